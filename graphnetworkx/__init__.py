@@ -10,42 +10,99 @@ See https://networkx.org for complete documentation.
 
 __version__ = "3.4.14"
 
+_removed = {
+    "nx_yaml": (
+        "\nThe nx_yaml module has been removed from graphnetworkx.\n"
+        "Please use the `yaml` package directly for working with yaml data.\n"
+        "For example, a graphnetworkx.Graph `G` can be written to and loaded\n"
+        "from a yaml file with:\n\n"
+        "    import yaml\n\n"
+        "    with open('path_to_yaml_file', 'w') as fh:\n"
+        "        yaml.dump(G, fh)\n"
+        "    with open('path_to_yaml_file', 'r') as fh:\n"
+        "        G = yaml.load(fh, Loader=yaml.Loader)\n\n"
+        "Note that yaml.Loader is considered insecure - see the pyyaml\n"
+        "documentation for further details.\n\n"
+    ),
+    "read_yaml": (
+        "\nread_yaml has been removed from graphnetworkx, please use `yaml`\n"
+        "directly:\n\n"
+        "    import yaml\n\n"
+        "    with open('path', 'r') as fh:\n"
+        "        yaml.load(fh, Loader=yaml.Loader)\n\n"
+        "Note that yaml.Loader is considered insecure - see the pyyaml\n"
+        "documentation for further details.\n\n"
+    ),
+    "write_yaml": (
+        "\nwrite_yaml has been removed from graphnetworkx, please use `yaml`\n"
+        "directly:\n\n"
+        "    import yaml\n\n"
+        "    with open('path_for_yaml_output', 'w') as fh:\n"
+        "        yaml.dump(G_to_be_yaml, path_for_yaml_output, **kwds)\n\n"
+    ),
+}
+
+
+import threading as _threading
+
+# Subpackages imported on first access to one of their names (PEP 562).
+# Loading them populates this namespace as `from ... import *` would.
+# Filled in at the end of this file, once the eager imports are done.
+_lazy_submodules = ()
+# Generator functions are looked up one at a time, so that using one of
+# them only imports its own submodule of generators.
+_lazy_generators = frozenset()
+# Held while the lazy submodules are loaded, so that other threads wait
+# for the full namespace instead of finding it half populated.
+_lazy_lock = _threading.RLock()
+_lazy_loading = False
+
+
+def _load_lazy_submodules():
+    import importlib
+
+    global _lazy_submodules, _lazy_loading
+    with _lazy_lock:
+        if _lazy_loading:
+            # Reentered from one of the imports below, which is still running
+            return
+        _lazy_loading = True
+        try:
+            for modname in _lazy_submodules:
+                module = importlib.import_module(f"{__name__}.{modname}")
+                globals().update(
+                    (attr, getattr(module, attr))
+                    for attr in dir(module)
+                    if not attr.startswith("_")
+                )
+            # Only forget the submodules once all of them are loaded, so a
+            # failed import is retried on the next lookup.
+            _lazy_submodules = ()
+        finally:
+            _lazy_loading = False
+
 
 def __getattr__(name):
-    """Remove functions and provide informative error messages."""
-    if name == "nx_yaml":
-        raise ImportError(
-            "\nThe nx_yaml module has been removed from graphnetworkx.\n"
-            "Please use the `yaml` package directly for working with yaml data.\n"
-            "For example, a graphnetworkx.Graph `G` can be written to and loaded\n"
-            "from a yaml file with:\n\n"
-            "    import yaml\n\n"
-            "    with open('path_to_yaml_file', 'w') as fh:\n"
-            "        yaml.dump(G, fh)\n"
-            "    with open('path_to_yaml_file', 'r') as fh:\n"
-            "        G = yaml.load(fh, Loader=yaml.Loader)\n\n"
-            "Note that yaml.Loader is considered insecure - see the pyyaml\n"
-            "documentation for further details.\n\n"
-        )
-    if name == "read_yaml":
-        raise ImportError(
-            "\nread_yaml has been removed from graphnetworkx, please use `yaml`\n"
-            "directly:\n\n"
-            "    import yaml\n\n"
-            "    with open('path', 'r') as fh:\n"
-            "        yaml.load(fh, Loader=yaml.Loader)\n\n"
-            "Note that yaml.Loader is considered insecure - see the pyyaml\n"
-            "documentation for further details.\n\n"
-        )
-    if name == "write_yaml":
-        raise ImportError(
-            "\nwrite_yaml has been removed from graphnetworkx, please use `yaml`\n"
-            "directly:\n\n"
-            "    import yaml\n\n"
-            "    with open('path_for_yaml_output', 'w') as fh:\n"
-            "        yaml.dump(G_to_be_yaml, path_for_yaml_output, **kwds)\n\n"
-        )
-    raise AttributeError(f"module {__name__} has no attribute {name}")
+    """Load lazy submodules and provide informative errors for removed functions."""
+    msg = _removed.get(name)
+    if msg is not None:
+        raise ImportError(msg)
+    if name in _lazy_generators:
+        # Only import the generator submodule that provides name
+        value = globals()[name] = getattr(generators, name)
+        return value
+    _load_lazy_submodules()
+    if name == "__all__":
+        return [attr for attr in globals() if not attr.startswith("_")]
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__} has no attribute {name}") from None
+
+
+def __dir__():
+    _load_lazy_submodules()
+    return list(globals())
 
 
 # These are import orderwise
@@ -67,19 +124,15 @@ from graphnetworkx import relabel
 from graphnetworkx.relabel import *
 
 from graphnetworkx import generators
-from graphnetworkx.generators import *
 
 from graphnetworkx import readwrite
 from graphnetworkx.readwrite import *
 
-# Need to test with SciPy, when available
-from graphnetworkx import algorithms
-from graphnetworkx.algorithms import *
-
-from graphnetworkx import linalg
-from graphnetworkx.linalg import *
-
 from graphnetworkx.testing.test import run as test
 
-from graphnetworkx import drawing
-from graphnetworkx.drawing import *
+# This submodule name is shadowed by algorithms, so drop it until
+# algorithms, linalg and drawing are loaded by __getattr__
+del tree
+
+_lazy_submodules = ("generators", "algorithms", "linalg", "drawing")
+_lazy_generators = frozenset(generators.__all__)
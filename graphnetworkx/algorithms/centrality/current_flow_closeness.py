@@ -7,6 +7,7 @@ from graphnetworkx.algorithms.centrality.flow_matrix import (
     FullInverseLaplacian,
     laplacian_sparse_matrix,
     SuperLUInverseLaplacian,
+    UMFPACKInverseLaplacian,
 )
 
 __all__ = ["current_flow_closeness_centrality", "information_centrality"]
@@ -38,7 +39,9 @@ def current_flow_closeness_centrality(G, weight=None, dtype=float, solver="lu"):
     solver: string (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). The "umfpack" option uses the UMFPACK
+       factorization from scikit-umfpack; if that package is not
+       installed, it warns and falls back to "lu".
 
     Returns
     -------
@@ -68,32 +71,29 @@ def current_flow_closeness_centrality(G, weight=None, dtype=float, solver="lu"):
        Social Networks 11(1):1-37, 1989.
        https://doi.org/10.1016/0378-8733(89)90016-6
     """
+    import numpy as np
+
     if not nx.is_connected(G):
         raise nx.NetworkXError("Graph not connected.")
     solvername = {
         "full": FullInverseLaplacian,
         "lu": SuperLUInverseLaplacian,
         "cg": CGInverseLaplacian,
+        "umfpack": UMFPACKInverseLaplacian,
     }
     n = G.number_of_nodes()
     ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    n = H.number_of_nodes()
+    # index the Laplacian by the rcm ordering instead of relabeling G
     L = laplacian_sparse_matrix(
-        H, nodelist=range(n), weight=weight, dtype=dtype, format="csc"
+        G, nodelist=ordering, weight=weight, dtype=dtype, format="csc"
     )
     C2 = solvername[solver](L, width=1, dtype=dtype)  # initialize solver
-    for v in H:
-        col = C2.get_row(v)
-        for w in H:
-            betweenness[v] += col[v] - 2 * col[w]
-            betweenness[w] += col[v]
-    for v in H:
-        betweenness[v] = 1.0 / (betweenness[v])
-    return {ordering[k]: float(v) for k, v in betweenness.items()}
+    # b[v] = sum_w C[v, v] + C[w, w] - 2 * C[v, w] only needs the diagonal
+    # of the inverse Laplacian C and its row sums C @ 1 (a single solve)
+    diag = C2.diagonal()
+    betweenness = n * diag + diag.sum() - 2 * C2.solve(np.ones(n, dtype=dtype))
+    betweenness = 1.0 / betweenness
+    return dict(zip(ordering, betweenness.tolist()))
 
 
 information_centrality = current_flow_closeness_centrality
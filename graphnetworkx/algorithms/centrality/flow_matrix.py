@@ -1,5 +1,7 @@
 # Helpers for current-flow betweenness and current-flow closness
 # Lazy computations for inverse Laplacian and flow-matrix rows.
+import warnings
+
 import graphnetworkx as nx
 
 
@@ -67,6 +69,12 @@ class InverseLaplacian:
         self.C[r % self.w, 1:] = self.solve_inverse(r)
         return self.C[r % self.w]
 
+    def diagonal(self):
+        d = np.zeros(self.n, dtype=self.dtype)
+        for r in range(1, self.n):
+            d[r] = self.solve_inverse(r)[r - 1]
+        return d
+
     def width(self, L):
         m = 0
         for i, row in enumerate(L):
@@ -81,8 +89,14 @@ class InverseLaplacian:
 
 class FullInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
+        import scipy as sp
+        import scipy.linalg  # call as sp.linalg
+
+        # the grounded Laplacian is symmetric positive definite
+        n = self.n - 1
+        factor = sp.linalg.cho_factor(self.L1.toarray())
         self.IL = np.zeros(L.shape, dtype=self.dtype)
-        self.IL[1:, 1:] = np.linalg.inv(self.L1.todense())
+        self.IL[1:, 1:] = sp.linalg.cho_solve(factor, np.identity(n, dtype=self.dtype))
 
     def solve(self, rhs):
         s = np.zeros(rhs.shape, dtype=self.dtype)
@@ -92,25 +106,76 @@ class FullInverseLaplacian(InverseLaplacian):
     def solve_inverse(self, r):
         return self.IL[r, 1:]
 
+    def diagonal(self):
+        return self.IL.diagonal().copy()
+
 
 class SuperLUInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
         import scipy as sp
         import scipy.sparse.linalg  # call as sp.sparse.linalg
 
-        self.lusolve = sp.sparse.linalg.factorized(self.L1.tocsc())
+        # The grounded Laplacian is symmetric and diagonally dominant, so use
+        # a minimum degree ordering on its structure and skip pivoting.
+        self.lusolve = sp.sparse.linalg.splu(
+            self.L1.tocsc(),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0,
+            options={"SymmetricMode": True},
+        ).solve
 
     def solve_inverse(self, r):
         rhs = np.zeros(self.n, dtype=self.dtype)
         rhs[r] = 1
         return self.lusolve(rhs[1:])
 
+    def diagonal(self, blocksize=256, max_block_entries=2 ** 22):
+        # solve against blocks of identity columns so that each call
+        # into SuperLU handles many right-hand sides at once. A block and
+        # its solution are dense n x blocksize arrays, so the block size
+        # shrinks for large n to keep each under max_block_entries entries
+        # (32 MB in double precision).
+        n = self.n - 1
+        blocksize = min(blocksize, max(1, max_block_entries // n))
+        d = np.zeros(self.n, dtype=self.dtype)
+        for start in range(0, n, blocksize):
+            stop = min(start + blocksize, n)
+            idx = np.arange(stop - start)
+            B = np.zeros((n, stop - start), dtype=self.dtype)
+            B[start + idx, idx] = 1
+            d[start + 1 : stop + 1] = self.lusolve(B)[start + idx, idx]
+        return d
+
     def solve(self, rhs):
         s = np.zeros(rhs.shape, dtype=self.dtype)
         s[1:] = self.lusolve(rhs[1:])
         return s
 
 
+class UMFPACKInverseLaplacian(SuperLUInverseLaplacian):
+    # UMFPACK through scikit-umfpack, falls back to SuperLU if missing
+    def init_solver(self, L):
+        try:
+            import scikits.umfpack
+        except ImportError:
+            warnings.warn(
+                "scikit-umfpack is not installed, using the 'lu' solver instead.",
+                RuntimeWarning,
+                stacklevel=4,
+            )
+            return super().init_solver(L)
+        solve = scikits.umfpack.splu(self.L1.tocsc().astype(np.float64)).solve
+
+        def lusolve(rhs):
+            rhs = np.asarray(rhs, dtype=np.float64)
+            if rhs.ndim == 1:
+                return solve(rhs)
+            # solve blocks of right-hand sides one column at a time
+            return np.column_stack([solve(col) for col in rhs.T])
+
+        self.lusolve = lusolve
+
+
 class CGInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
         global sp
@@ -126,10 +191,20 @@ class CGInverseLaplacian(InverseLaplacian):
         s[1:] = sp.sparse.linalg.cg(self.L1, rhs[1:], M=self.M, atol=0)[0]
         return s
 
-    def solve_inverse(self, r):
+    def solve_inverse(self, r, x0=None):
         rhs = np.zeros(self.n, self.dtype)
         rhs[r] = 1
-        return sp.sparse.linalg.cg(self.L1, rhs[1:], M=self.M, atol=0)[0]
+        return sp.sparse.linalg.cg(self.L1, rhs[1:], x0=x0, M=self.M, atol=0)[0]
+
+    def diagonal(self):
+        # warm-start each column from the previous one, which is close to it
+        # for neighboring nodes in the (rcm) ordering
+        d = np.zeros(self.n, dtype=self.dtype)
+        x = None
+        for r in range(1, self.n):
+            x = self.solve_inverse(r, x0=x)
+            d[r] = x[r - 1]
+        return d
 
 
 # graph laplacian, sparse version, will move to linalg/laplacianmatrix.py
@@ -1,6 +1,6 @@
 import pytest
 
-pytest.importorskip("numpy")
+np = pytest.importorskip("numpy")
 pytest.importorskip("scipy")
 
 import graphnetworkx as nx
@@ -23,6 +23,52 @@ class TestFlowClosenessCentrality:
         for n in sorted(G):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
 
+    def test_P4_float32(self):
+        """Closeness centrality: P4 with float32 working buffers"""
+        G = nx.path_graph(4)
+        b_answer = {0: 1.0 / 6, 1: 1.0 / 4, 2: 1.0 / 4, 3: 1.0 / 6}
+        for solver in ["full", "lu", "cg"]:
+            b = nx.current_flow_closeness_centrality(G, dtype=np.float32, solver=solver)
+            for n in sorted(G):
+                assert b[n] == pytest.approx(b_answer[n], abs=1e-5)
+
+    def test_lu_diagonal_blocks(self):
+        """Inverse Laplacian diagonal: blocked LU solves match the full inverse"""
+        from graphnetworkx.algorithms.centrality.flow_matrix import (
+            FullInverseLaplacian,
+            SuperLUInverseLaplacian,
+            laplacian_sparse_matrix,
+        )
+
+        G = nx.grid_2d_graph(6, 6)
+        L = laplacian_sparse_matrix(G, weight=None, dtype=float, format="csc")
+        d_answer = FullInverseLaplacian(L, width=1, dtype=float).diagonal()
+        C = SuperLUInverseLaplacian(L, width=1, dtype=float)
+        # the second call caps the blocks at 70 // 35 == 2 columns
+        for d in (C.diagonal(), C.diagonal(max_block_entries=70)):
+            np.testing.assert_allclose(d, d_answer, atol=1e-12)
+
+    def test_umfpack(self):
+        """Closeness centrality: UMFPACK solver matches LU"""
+        pytest.importorskip("scikits.umfpack")
+        # more than 256 nodes, so the diagonal is solved in several blocks
+        G = nx.grid_2d_graph(20, 20)
+        b = nx.current_flow_closeness_centrality(G, solver="umfpack")
+        b_answer = nx.current_flow_closeness_centrality(G, solver="lu")
+        for n in sorted(G):
+            assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
+
+    def test_umfpack_fallback(self, monkeypatch):
+        """Closeness centrality: UMFPACK solver falls back to LU"""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "scikits.umfpack", None)
+        G = nx.path_graph(4)
+        with pytest.warns(RuntimeWarning, match="scikit-umfpack"):
+            b = nx.current_flow_closeness_centrality(G, solver="umfpack")
+        b_answer = nx.current_flow_closeness_centrality(G, solver="lu")
+        assert b == pytest.approx(b_answer, abs=1e-7)
+
     def test_star(self):
         """Closeness centrality: star"""
         G = nx.Graph()
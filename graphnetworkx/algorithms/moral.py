@@ -29,6 +29,9 @@ def moral_graph(G):
     between these parent nodes are inserted and all directed edges become
     undirected.
 
+    For a MultiDiGraph, a pair of parents shared by several children is
+    joined by one parallel edge per child.
+
     https://en.wikipedia.org/wiki/Moral_graph
 
     References
@@ -41,7 +44,24 @@ def moral_graph(G):
         raise ValueError("Expected NetworkX graph!")
 
     H = G.to_undirected()
-    for preds in G.pred.values():
-        predecessors_combinations = itertools.combinations(preds, r=2)
+    if G.is_multigraph():
+        # every child adds its own parallel edge between each parent pair
+        predecessors_combinations = []
+        for preds in G._pred.values():
+            if len(preds) >= 2:
+                predecessors_combinations.extend(itertools.combinations(preds, r=2))
         H.add_edges_from(predecessors_combinations)
+        return H
+    # collect the parent pairs of every node for a single bulk insert.
+    # Parents are put in node order so that pairs shared by several
+    # children are only inserted once, without requiring sortable nodes.
+    index = {n: i for i, n in enumerate(G)}
+    predecessors_combinations = {}
+    for preds in G._pred.values():
+        if len(preds) >= 2:
+            preds = sorted(preds, key=index.__getitem__)
+            predecessors_combinations.update(
+                dict.fromkeys(itertools.combinations(preds, r=2))
+            )
+    H.add_edges_from(predecessors_combinations)
     return H
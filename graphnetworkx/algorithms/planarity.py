@@ -1,4 +1,3 @@
-from collections import defaultdict
 import graphnetworkx as nx
 
 __all__ = ["check_planarity", "PlanarEmbedding"]
@@ -83,8 +82,10 @@ def get_counterexample(G):
     Raises nx.NetworkXException if G is planar.
 
     The function removes edges such that the graph is still not planar.
-    At some point the removal of any edge would make the graph planar.
-    This subgraph must be a Kuratowski subgraph.
+    Edges are removed in chunks; a chunk whose removal would make the graph
+    planar is restored and split in halves. At some point the removal of any
+    edge would make the graph planar. This subgraph must be a Kuratowski
+    subgraph.
 
     Parameters
     ----------
@@ -102,17 +103,21 @@ def get_counterexample(G):
     if check_planarity(G)[0]:
         raise nx.NetworkXException("G is planar - no counter example.")
 
-    # find Kuratowski subgraph
-    subgraph = nx.Graph()
-    for u in G:
-        nbrs = list(G[u])
-        for v in nbrs:
-            G.remove_edge(u, v)
-            if check_planarity(G)[0]:
-                G.add_edge(u, v)
-                subgraph.add_edge(u, v)
+    # find Kuratowski subgraph by removing edges in chunks, a chunk whose
+    # removal makes G planar is put back and split until single edges remain
+    # only the planarity test is needed here, not the embedding
+    chunks = [list(G.edges)]
+    while chunks:
+        edges = chunks.pop()
+        G.remove_edges_from(edges)
+        if LRPlanarity(G).lr_test():
+            G.add_edges_from(edges)
+            if len(edges) > 1:
+                mid = len(edges) // 2
+                chunks.append(edges[mid:])
+                chunks.append(edges[:mid])
 
-    return subgraph
+    return nx.Graph(G.edges)
 
 
 def get_counterexample_recursive(G):
@@ -124,87 +129,87 @@ def get_counterexample_recursive(G):
     if check_planarity_recursive(G)[0]:
         raise nx.NetworkXException("G is planar - no counter example.")
 
-    # find Kuratowski subgraph
-    subgraph = nx.Graph()
-    for u in G:
-        nbrs = list(G[u])
-        for v in nbrs:
-            G.remove_edge(u, v)
-            if check_planarity_recursive(G)[0]:
-                G.add_edge(u, v)
-                subgraph.add_edge(u, v)
+    # find Kuratowski subgraph by removing edges in chunks, a chunk whose
+    # removal makes G planar is put back and split until single edges remain
+    # only the planarity test is needed here, not the embedding
+    chunks = [list(G.edges)]
+    while chunks:
+        edges = chunks.pop()
+        G.remove_edges_from(edges)
+        if LRPlanarity(G).lr_test_recursive():
+            G.add_edges_from(edges)
+            if len(edges) > 1:
+                mid = len(edges) // 2
+                chunks.append(edges[mid:])
+                chunks.append(edges[:mid])
 
-    return subgraph
-
-
-class Interval:
-    """Represents a set of return edges.
-
-    All return edges in an interval induce a same constraint on the contained
-    edges, which means that all edges must either have a left orientation or
-    all edges must have a right orientation.
-    """
-
-    def __init__(self, low=None, high=None):
-        self.low = low
-        self.high = high
-
-    def empty(self):
-        """Check if the interval is empty"""
-        return self.low is None and self.high is None
-
-    def copy(self):
-        """Returns a copy of this interval"""
-        return Interval(self.low, self.high)
-
-    def conflicting(self, b, planarity_state):
-        """Returns True if interval I conflicts with edge b"""
-        return (
-            not self.empty()
-            and planarity_state.lowpt[self.high] > planarity_state.lowpt[b]
-        )
+    return nx.Graph(G.edges)
 
 
 class ConflictPair:
     """Represents a different constraint between two intervals.
 
+    An interval represents a set of return edges by its lowest and highest
+    return edge, both are None if the interval is empty. All return edges in
+    an interval induce a same constraint on the contained edges, which means
+    that all edges must either have a left orientation or all edges must have
+    a right orientation.
+
     The edges in the left interval must have a different orientation than
     the one in the right interval.
     """
 
-    def __init__(self, left=Interval(), right=Interval()):
-        self.left = left
-        self.right = right
+    __slots__ = ["left_low", "left_high", "right_low", "right_high"]
+
+    def __init__(self, left_low=None, left_high=None, right_low=None, right_high=None):
+        self.left_low = left_low
+        self.left_high = left_high
+        self.right_low = right_low
+        self.right_high = right_high
 
     def swap(self):
         """Swap left and right intervals"""
-        temp = self.left
-        self.left = self.right
-        self.right = temp
+        self.left_low, self.right_low = self.right_low, self.left_low
+        self.left_high, self.right_high = self.right_high, self.left_high
+
+    def left_empty(self):
+        """Check if the left interval is empty"""
+        return self.left_low is None and self.left_high is None
+
+    def right_empty(self):
+        """Check if the right interval is empty"""
+        return self.right_low is None and self.right_high is None
+
+    def left_conflicting(self, b, planarity_state):
+        """Returns True if the left interval conflicts with edge b"""
+        return (
+            not self.left_empty()
+            and planarity_state.lowpt[self.left_high] > planarity_state.lowpt[b]
+        )
+
+    def right_conflicting(self, b, planarity_state):
+        """Returns True if the right interval conflicts with edge b"""
+        return (
+            not self.right_empty()
+            and planarity_state.lowpt[self.right_high] > planarity_state.lowpt[b]
+        )
 
     def lowest(self, planarity_state):
         """Returns the lowest lowpoint of a conflict pair"""
-        if self.left.empty():
-            return planarity_state.lowpt[self.right.low]
-        if self.right.empty():
-            return planarity_state.lowpt[self.left.low]
+        if self.left_empty():
+            return planarity_state.lowpt[self.right_low]
+        if self.right_empty():
+            return planarity_state.lowpt[self.left_low]
         return min(
-            planarity_state.lowpt[self.left.low], planarity_state.lowpt[self.right.low]
+            planarity_state.lowpt[self.left_low], planarity_state.lowpt[self.right_low]
         )
 
 
-def top_of_stack(l):
-    """Returns the element on top of the stack."""
-    if not l:
-        return None
-    return l[-1]
-
-
 class LRPlanarity:
     """A class to maintain the state during planarity check."""
 
     __slots__ = [
-        "G",
+        "nodes",
         "roots",
         "height",
         "lowpt",
@@ -212,6 +217,9 @@ class LRPlanarity:
         "nesting_depth",
         "parent_edge",
         "DG",
+        "oriented",
+        "source",
+        "target",
         "adjs",
         "ordered_adjs",
         "ref",
@@ -221,48 +229,67 @@ class LRPlanarity:
         "lowpt_edge",
         "left_ref",
         "right_ref",
-        "embedding",
+        "cw",
+        "ccw",
+        "first_nbr",
     ]
 
     def __init__(self, G):
-        # copy G without adding self-loops
-        self.G = nx.Graph()
-        self.G.add_nodes_from(G.nodes)
-        for e in G.edges:
-            if e[0] != e[1]:
-                self.G.add_edge(e[0], e[1])
+        # the algorithm works on integer node indices into this list
+        self.nodes = list(G)
+        index = {v: i for i, v in enumerate(self.nodes)}
+
+        # adjacency lists of G as a simple undirected graph without self-loops
+        self.adjs = []
+        pred = G._pred if G.is_directed() else None
+        for v, nbrs in G._adj.items():
+            if pred is not None:
+                nbrs = {**nbrs, **pred[v]}
+            self.adjs.append([index[w] for w in nbrs if w != v])
+
+        n = len(self.nodes)
+        # edges are numbered in the order they are oriented, the state of
+        # nodes and edges is kept in lists indexed by node and edge number
+        m = sum(map(len, self.adjs)) // 2
 
         self.roots = []
 
         # distance from tree root
-        self.height = defaultdict(lambda: None)
+        self.height = [None] * n
 
-        self.lowpt = {}  # height of lowest return point of an edge
-        self.lowpt2 = {}  # height of second lowest return point
-        self.nesting_depth = {}  # for nesting order
+        self.lowpt = [None] * m  # height of lowest return point of an edge
+        self.lowpt2 = [None] * m  # height of second lowest return point
+        self.nesting_depth = [None] * m  # for nesting order
 
         # None -> missing edge
-        self.parent_edge = defaultdict(lambda: None)
+        self.parent_edge = [None] * n
 
-        # oriented DFS graph
-        self.DG = nx.DiGraph()
-        self.DG.add_nodes_from(G.nodes)
+        # oriented DFS graph as lists of out edges, the end points of each
+        # edge, and the set of oriented node pairs keyed once for both
+        # directions as (min << 32) | max
+        self.DG = [[] for _ in range(n)]
+        self.source = []
+        self.target = []
+        self.oriented = set()
 
-        self.adjs = {}
-        self.ordered_adjs = {}
+        self.ordered_adjs = [None] * n
 
-        self.ref = defaultdict(lambda: None)
-        self.side = defaultdict(lambda: 1)
+        self.ref = [None] * m
+        self.side = [1] * m
 
         # stack of conflict pairs
         self.S = []
-        self.stack_bottom = {}
-        self.lowpt_edge = {}
+        self.stack_bottom = [None] * m
+        self.lowpt_edge = [None] * m
 
-        self.left_ref = {}
-        self.right_ref = {}
+        self.left_ref = [None] * n
+        self.right_ref = [None] * n
 
-        self.embedding = PlanarEmbedding()
+        # cyclic neighbor order of each node as it is built up, the
+        # PlanarEmbedding is created from it once the order is complete
+        self.cw = None
+        self.ccw = None
+        self.first_nbr = None
 
     def lr_planarity(self):
         """Execute the LR planarity test.
@@ -272,35 +299,75 @@ class LRPlanarity:
         embedding : dict
             If the graph is planar an embedding is returned. Otherwise None.
         """
-        if self.G.order() > 2 and self.G.size() > 3 * self.G.order() - 6:
+        if not self.lr_test():
             # graph is not planar
             return None
 
-        # make adjacency lists for dfs
-        for v in self.G:
-            self.adjs[v] = list(self.G[v])
+        # resolve the sides of all edges, then apply them to the nesting depths
+        for e, ref in enumerate(self.ref):
+            if ref is not None:
+                self.sign(e)
+        self.nesting_depth = [d * s for d, s in zip(self.nesting_depth, self.side)]
+        # vertices with an out edge whose nesting depth changes sign
+        flipped = {v for v, s in zip(self.source, self.side) if s == -1}
+
+        self.init_embedding(flipped)
+
+        # Free no longer used variables
+        self.DG = None
+        self.nesting_depth = None
+        self.ref = None
+
+        # compute the complete embedding
+        for v in self.roots:
+            self.dfs_embedding(v)
+
+        # Free no longer used variables
+        self.roots = None
+        self.parent_edge = None
+        self.ordered_adjs = None
+        self.left_ref = None
+        self.right_ref = None
+        self.side = None
+
+        return self.build_embedding()
+
+    def lr_test(self):
+        """Execute the orientation and testing phases of the LR planarity test.
+
+        Returns
+        -------
+        is_planar : bool
+            True if the graph is planar, the embedding phase of
+            :meth:`lr_planarity` can only follow in that case.
+        """
+        n = len(self.nodes)
+        if n > 2 and len(self.lowpt) > 3 * n - 6:
+            # graph is not planar
+            return False
 
         # orientation of the graph by depth first search traversal
-        for v in self.G:
+        for v in range(n):
             if self.height[v] is None:
                 self.height[v] = 0
                 self.roots.append(v)
-                self.dfs_orientation(v)
+                num_edges = len(self.target)
+                num_nodes = self.dfs_orientation(v)
+                num_edges = len(self.target) - num_edges
+                if num_nodes > 2 and num_edges > 3 * num_nodes - 6:
+                    # connected component is not planar
+                    return False
 
         # Free no longer used variables
-        self.G = None
         self.lowpt2 = None
         self.adjs = None
+        self.oriented = None
 
         # testing
-        for v in self.DG:  # sort the adjacency lists by nesting depth
-            # note: this sorting leads to non linear time
-            self.ordered_adjs[v] = sorted(
-                self.DG[v], key=lambda x: self.nesting_depth[(v, x)]
-            )
+        self.sort_by_nesting_depth()
         for v in self.roots:
             if not self.dfs_testing(v):
-                return None
+                return False
 
         # Free no longer used variables
         self.height = None
@@ -309,215 +376,308 @@ class LRPlanarity:
         self.stack_bottom = None
         self.lowpt_edge = None
 
-        for e in self.DG.edges:
-            self.nesting_depth[e] = self.sign(e) * self.nesting_depth[e]
+        return True
 
-        self.embedding.add_nodes_from(self.DG.nodes)
-        for v in self.DG:
-            # sort the adjacency lists again
-            self.ordered_adjs[v] = sorted(
-                self.DG[v], key=lambda x: self.nesting_depth[(v, x)]
-            )
-            # initialize the embedding
-            previous_node = None
-            for w in self.ordered_adjs[v]:
-                self.embedding.add_half_edge_cw(v, w, previous_node)
-                previous_node = w
+    def lr_planarity_recursive(self):
+        """Recursive version of :meth:`lr_planarity`."""
+        if not self.lr_test_recursive():
+            # graph is not planar
+            return None
 
-        # Free no longer used variables
-        self.DG = None
-        self.nesting_depth = None
-        self.ref = None
+        # resolve the sides of all edges, then apply them to the nesting depths
+        for e, ref in enumerate(self.ref):
+            if ref is not None:
+                self.sign_recursive(e)
+        self.nesting_depth = [d * s for d, s in zip(self.nesting_depth, self.side)]
+        # vertices with an out edge whose nesting depth changes sign
+        flipped = {v for v, s in zip(self.source, self.side) if s == -1}
+
+        self.init_embedding(flipped)
 
         # compute the complete embedding
         for v in self.roots:
-            self.dfs_embedding(v)
-
-        # Free no longer used variables
-        self.roots = None
-        self.parent_edge = None
-        self.ordered_adjs = None
-        self.left_ref = None
-        self.right_ref = None
-        self.side = None
+            self.dfs_embedding_recursive(v)
 
-        return self.embedding
+        return self.build_embedding()
 
-    def lr_planarity_recursive(self):
-        """Recursive version of :meth:`lr_planarity`."""
-        if self.G.order() > 2 and self.G.size() > 3 * self.G.order() - 6:
+    def lr_test_recursive(self):
+        """Recursive version of :meth:`lr_test`."""
+        n = len(self.nodes)
+        if n > 2 and len(self.lowpt) > 3 * n - 6:
             # graph is not planar
-            return None
+            return False
 
         # orientation of the graph by depth first search traversal
-        for v in self.G:
+        for v in range(n):
             if self.height[v] is None:
                 self.height[v] = 0
                 self.roots.append(v)
-                self.dfs_orientation_recursive(v)
-
-        # Free no longer used variable
-        self.G = None
+                num_edges = len(self.target)
+                num_nodes = self.dfs_orientation_recursive(v)
+                num_edges = len(self.target) - num_edges
+                if num_nodes > 2 and num_edges > 3 * num_nodes - 6:
+                    # connected component is not planar
+                    return False
 
         # testing
-        for v in self.DG:  # sort the adjacency lists by nesting depth
-            # note: this sorting leads to non linear time
-            self.ordered_adjs[v] = sorted(
-                self.DG[v], key=lambda x: self.nesting_depth[(v, x)]
-            )
+        self.sort_by_nesting_depth()
         for v in self.roots:
             if not self.dfs_testing_recursive(v):
-                return None
+                return False
 
-        for e in self.DG.edges:
-            self.nesting_depth[e] = self.sign_recursive(e) * self.nesting_depth[e]
+        return True
 
-        self.embedding.add_nodes_from(self.DG.nodes)
-        for v in self.DG:
-            # sort the adjacency lists again
-            self.ordered_adjs[v] = sorted(
-                self.DG[v], key=lambda x: self.nesting_depth[(v, x)]
-            )
+    def init_embedding(self, flipped):
+        """Order the neighbors of each node by the nesting order of its out edges.
+
+        Only the adjacency lists of the vertices in `flipped` are sorted
+        again, the others keep the order used for testing.
+        """
+        target = self.target
+        # sort the adjacency lists again
+        self.sort_by_nesting_depth(flipped)
+        self.cw = []
+        self.ccw = []
+        self.first_nbr = []
+        for ordered_adj in self.ordered_adjs:
             # initialize the embedding
-            previous_node = None
-            for w in self.ordered_adjs[v]:
-                self.embedding.add_half_edge_cw(v, w, previous_node)
-                previous_node = w
+            nbrs = [target[e] for e in ordered_adj]
+            self.cw.append(dict(zip(nbrs, nbrs[1:] + nbrs[:1])))
+            self.ccw.append(dict(zip(nbrs, nbrs[-1:] + nbrs[:-1])))
+            self.first_nbr.append(nbrs[0] if nbrs else None)
+
+    def build_embedding(self):
+        """Returns the PlanarEmbedding given by the cyclic neighbor orders."""
+        nodes = self.nodes
+        embedding = PlanarEmbedding()
+        embedding.add_nodes_from(nodes)
+        for v, start in enumerate(self.first_nbr):
+            if start is None:
+                continue  # v has no neighbors
+            cw = self.cw[v]
+            cw_order = [nodes[start]]
+            w = cw[start]
+            while w != start:
+                cw_order.append(nodes[w])
+                w = cw[w]
+            embedding._set_cw_order(nodes[v], cw_order)
+        return embedding
 
-        # compute the complete embedding
-        for v in self.roots:
-            self.dfs_embedding_recursive(v)
+    def add_half_edge_cw(self, start, end, reference):
+        """Places end directly after reference in the order of start."""
+        cw = self.cw[start]
+        ccw = self.ccw[start]
+        cw_reference = cw[reference]
+        cw[reference] = end
+        cw[end] = cw_reference
+        ccw[cw_reference] = end
+        ccw[end] = reference
+
+    def add_half_edge_ccw(self, start, end, reference):
+        """Places end directly before reference in the order of start."""
+        self.add_half_edge_cw(start, end, self.ccw[start][reference])
+        if reference == self.first_nbr[start]:
+            self.first_nbr[start] = end
+
+    def add_half_edge_first(self, start, end):
+        """Places end at the first position in the order of start."""
+        reference = self.first_nbr[start]
+        if reference is None:
+            self.cw[start][end] = end
+            self.ccw[start][end] = end
+            self.first_nbr[start] = end
+        else:
+            self.add_half_edge_ccw(start, end, reference)
+
+    def sort_by_nesting_depth(self, vertices=None):
+        """Order the oriented adjacency lists by nesting depth.
 
-        return self.embedding
+        If `vertices` is given only their adjacency lists are sorted.
+        """
+        # note: this sorting leads to non linear time
+        key = self.nesting_depth.__getitem__
+        ordered_adjs = self.ordered_adjs
+        if vertices is None:
+            vertices = range(len(self.DG))
+        for v in vertices:
+            out_adj = self.DG[v]
+            if len(out_adj) < 2:
+                ordered_adjs[v] = out_adj[:]
+            else:
+                ordered_adjs[v] = sorted(out_adj, key=key)
 
     def dfs_orientation(self, v):
-        """Orient the graph by DFS, compute lowpoints and nesting order."""
+        """Orient the graph by DFS, compute lowpoints and nesting order.
+
+        Returns the number of vertices reached from `v`.
+        """
+        # bind the state to locals, this loop runs once per edge
+        adjs = self.adjs
+        DG = self.DG
+        source = self.source
+        target = self.target
+        oriented = self.oriented
+        height = self.height
+        lowpt = self.lowpt
+        lowpt2 = self.lowpt2
+        nesting_depth = self.nesting_depth
+        parent_edge = self.parent_edge
+
+        num_nodes = 1
         # the recursion stack
         dfs_stack = [v]
         # index of next edge to handle in adjacency list of each node
-        ind = defaultdict(lambda: 0)
-        # boolean to indicate whether to skip the initial work for an edge
-        skip_init = defaultdict(lambda: False)
+        ind = {v: 0}
+        # edges for which to skip the initial work
+        skip_init = set()
 
         while dfs_stack:
             v = dfs_stack.pop()
-            e = self.parent_edge[v]
+            e = parent_edge[v]
 
-            for w in self.adjs[v][ind[v] :]:
-                vw = (v, w)
-
-                if not skip_init[vw]:
-                    if (v, w) in self.DG.edges or (w, v) in self.DG.edges:
-                        ind[v] += 1
+            for i, w in enumerate(adjs[v][ind[v] :], ind[v]):
+                vw = (v << 32) | w
+                if vw in skip_init:
+                    ei = parent_edge[w]
+                else:
+                    key = vw if v < w else (w << 32) | v
+                    if key in oriented:
                         continue  # the edge was already oriented
 
-                    self.DG.add_edge(v, w)  # orient the edge
-
-                    self.lowpt[vw] = self.height[v]
-                    self.lowpt2[vw] = self.height[v]
-                    if self.height[w] is None:  # (v, w) is a tree edge
-                        self.parent_edge[w] = vw
-                        self.height[w] = self.height[v] + 1
-
+                    # orient the edge
+                    ei = len(target)
+                    source.append(v)
+                    target.append(w)
+                    DG[v].append(ei)
+                    oriented.add(key)
+
+                    lowpt[ei] = height[v]
+                    lowpt2[ei] = height[v]
+                    if height[w] is None:  # (v, w) is a tree edge
+                        parent_edge[w] = ei
+                        height[w] = height[v] + 1
+                        num_nodes += 1
+
+                        ind[v] = i  # resume at this edge when revisiting v
+                        ind[w] = 0
                         dfs_stack.append(v)  # revisit v after finishing w
                         dfs_stack.append(w)  # visit w next
-                        skip_init[vw] = True  # don't redo this block
+                        skip_init.add(vw)  # don't redo this block
                         break  # handle next node in dfs_stack (i.e. w)
                     else:  # (v, w) is a back edge
-                        self.lowpt[vw] = self.height[w]
+                        lowpt[ei] = height[w]
 
                 # determine nesting graph
-                self.nesting_depth[vw] = 2 * self.lowpt[vw]
-                if self.lowpt2[vw] < self.height[v]:  # chordal
-                    self.nesting_depth[vw] += 1
+                nesting_depth[ei] = 2 * lowpt[ei]
+                if lowpt2[ei] < height[v]:  # chordal
+                    nesting_depth[ei] += 1
 
                 # update lowpoints of parent edge e
                 if e is not None:
-                    if self.lowpt[vw] < self.lowpt[e]:
-                        self.lowpt2[e] = min(self.lowpt[e], self.lowpt2[vw])
-                        self.lowpt[e] = self.lowpt[vw]
-                    elif self.lowpt[vw] > self.lowpt[e]:
-                        self.lowpt2[e] = min(self.lowpt2[e], self.lowpt[vw])
+                    if lowpt[ei] < lowpt[e]:
+                        lowpt2[e] = min(lowpt[e], lowpt2[ei])
+                        lowpt[e] = lowpt[ei]
+                    elif lowpt[ei] > lowpt[e]:
+                        lowpt2[e] = min(lowpt2[e], lowpt[ei])
                     else:
-                        self.lowpt2[e] = min(self.lowpt2[e], self.lowpt2[vw])
+                        lowpt2[e] = min(lowpt2[e], lowpt2[ei])
 
-                ind[v] += 1
+        return num_nodes
 
     def dfs_orientation_recursive(self, v):
         """Recursive version of :meth:`dfs_orientation`."""
+        num_nodes = 1
         e = self.parent_edge[v]
-        for w in self.G[v]:
-            if (v, w) in self.DG.edges or (w, v) in self.DG.edges:
+        for w in self.adjs[v]:
+            key = (v << 32) | w if v < w else (w << 32) | v
+            if key in self.oriented:
                 continue  # the edge was already oriented
-            vw = (v, w)
-            self.DG.add_edge(v, w)  # orient the edge
-
-            self.lowpt[vw] = self.height[v]
-            self.lowpt2[vw] = self.height[v]
+            # orient the edge
+            ei = len(self.target)
+            self.source.append(v)
+            self.target.append(w)
+            self.DG[v].append(ei)
+            self.oriented.add(key)
+
+            self.lowpt[ei] = self.height[v]
+            self.lowpt2[ei] = self.height[v]
             if self.height[w] is None:  # (v, w) is a tree edge
-                self.parent_edge[w] = vw
+                self.parent_edge[w] = ei
                 self.height[w] = self.height[v] + 1
-                self.dfs_orientation_recursive(w)
+                num_nodes += self.dfs_orientation_recursive(w)
             else:  # (v, w) is a back edge
-                self.lowpt[vw] = self.height[w]
+                self.lowpt[ei] = self.height[w]
 
             # determine nesting graph
-            self.nesting_depth[vw] = 2 * self.lowpt[vw]
-            if self.lowpt2[vw] < self.height[v]:  # chordal
-                self.nesting_depth[vw] += 1
+            self.nesting_depth[ei] = 2 * self.lowpt[ei]
+            if self.lowpt2[ei] < self.height[v]:  # chordal
+                self.nesting_depth[ei] += 1
 
             # update lowpoints of parent edge e
             if e is not None:
-                if self.lowpt[vw] < self.lowpt[e]:
-                    self.lowpt2[e] = min(self.lowpt[e], self.lowpt2[vw])
-                    self.lowpt[e] = self.lowpt[vw]
-                elif self.lowpt[vw] > self.lowpt[e]:
-                    self.lowpt2[e] = min(self.lowpt2[e], self.lowpt[vw])
+                if self.lowpt[ei] < self.lowpt[e]:
+                    self.lowpt2[e] = min(self.lowpt[e], self.lowpt2[ei])
+                    self.lowpt[e] = self.lowpt[ei]
+                elif self.lowpt[ei] > self.lowpt[e]:
+                    self.lowpt2[e] = min(self.lowpt2[e], self.lowpt[ei])
                 else:
-                    self.lowpt2[e] = min(self.lowpt2[e], self.lowpt2[vw])
+                    self.lowpt2[e] = min(self.lowpt2[e], self.lowpt2[ei])
+
+        return num_nodes
 
     def dfs_testing(self, v):
         """Test for LR partition."""
+        # bind the state to locals, this loop runs once per edge
+        ordered_adjs = self.ordered_adjs
+        target = self.target
+        parent_edge = self.parent_edge
+        height = self.height
+        lowpt = self.lowpt
+        lowpt_edge = self.lowpt_edge
+        stack_bottom = self.stack_bottom
+        S = self.S
+
         # the recursion stack
         dfs_stack = [v]
         # index of next edge to handle in adjacency list of each node
-        ind = defaultdict(lambda: 0)
-        # boolean to indicate whether to skip the initial work for an edge
-        skip_init = defaultdict(lambda: False)
+        ind = {v: 0}
+        # edges for which to skip the initial work
+        skip_init = set()
 
         while dfs_stack:
             v = dfs_stack.pop()
-            e = self.parent_edge[v]
+            e = parent_edge[v]
+            height_v = height[v]
+            ordered_adj = ordered_adjs[v]
             # to indicate whether to skip the final block after the for loop
             skip_final = False
 
-            for w in self.ordered_adjs[v][ind[v] :]:
-                ei = (v, w)
-
-                if not skip_init[ei]:
-                    self.stack_bottom[ei] = top_of_stack(self.S)
+            for i, ei in enumerate(ordered_adj[ind[v] :], ind[v]):
+                if ei not in skip_init:
+                    stack_bottom[ei] = S[-1] if S else None
 
-                    if ei == self.parent_edge[w]:  # tree edge
+                    w = target[ei]
+                    if ei == parent_edge[w]:  # tree edge
+                        ind[v] = i  # resume at this edge when revisiting v
+                        ind[w] = 0
                         dfs_stack.append(v)  # revisit v after finishing w
                         dfs_stack.append(w)  # visit w next
-                        skip_init[ei] = True  # don't redo this block
+                        skip_init.add(ei)  # don't redo this block
                         skip_final = True  # skip final work after breaking
                         break  # handle next node in dfs_stack (i.e. w)
                     else:  # back edge
-                        self.lowpt_edge[ei] = ei
-                        self.S.append(ConflictPair(right=Interval(ei, ei)))
+                        lowpt_edge[ei] = ei
+                        S.append(ConflictPair(right_low=ei, right_high=ei))
 
                 # integrate new return edges
-                if self.lowpt[ei] < self.height[v]:
-                    if w == self.ordered_adjs[v][0]:  # e_i has return edge
-                        self.lowpt_edge[e] = self.lowpt_edge[ei]
+                if lowpt[ei] < height_v:
+                    if ei == ordered_adj[0]:  # e_i has return edge
+                        lowpt_edge[e] = lowpt_edge[ei]
                     else:  # add constraints of e_i
                         if not self.add_constraints(ei, e):
                             # graph is not planar
                             return False
 
-                ind[v] += 1
-
             if not skip_final:
                 # remove back edges returning to parent
                 if e is not None:  # v isn't root
@@ -528,19 +688,19 @@ class LRPlanarity:
     def dfs_testing_recursive(self, v):
         """Recursive version of :meth:`dfs_testing`."""
         e = self.parent_edge[v]
-        for w in self.ordered_adjs[v]:
-            ei = (v, w)
-            self.stack_bottom[ei] = top_of_stack(self.S)
+        for ei in self.ordered_adjs[v]:
+            w = self.target[ei]
+            self.stack_bottom[ei] = self.S[-1] if self.S else None
             if ei == self.parent_edge[w]:  # tree edge
                 if not self.dfs_testing_recursive(w):
                     return False
             else:  # back edge
                 self.lowpt_edge[ei] = ei
-                self.S.append(ConflictPair(right=Interval(ei, ei)))
+                self.S.append(ConflictPair(right_low=ei, right_high=ei))
 
             # integrate new return edges
             if self.lowpt[ei] < self.height[v]:
-                if w == self.ordered_adjs[v][0]:  # e_i has return edge
+                if ei == self.ordered_adjs[v][0]:  # e_i has return edge
                     self.lowpt_edge[e] = self.lowpt_edge[ei]
                 else:  # add constraints of e_i
                     if not self.add_constraints(ei, e):
@@ -553,82 +713,82 @@ class LRPlanarity:
         return True
 
     def add_constraints(self, ei, e):
+        S = self.S
         P = ConflictPair()
         # merge return edges of e_i into P.right
         while True:
-            Q = self.S.pop()
-            if not Q.left.empty():
+            Q = S.pop()
+            if not Q.left_empty():
                 Q.swap()
-            if not Q.left.empty():  # not planar
+            if not Q.left_empty():  # not planar
                 return False
-            if self.lowpt[Q.right.low] > self.lowpt[e]:
+            if self.lowpt[Q.right_low] > self.lowpt[e]:
                 # merge intervals
-                if P.right.empty():  # topmost interval
-                    P.right = Q.right.copy()
+                if P.right_empty():  # topmost interval
+                    P.right_high = Q.right_high
                 else:
-                    self.ref[P.right.low] = Q.right.high
-                P.right.low = Q.right.low
+                    self.ref[P.right_low] = Q.right_high
+                P.right_low = Q.right_low
             else:  # align
-                self.ref[Q.right.low] = self.lowpt_edge[e]
-            if top_of_stack(self.S) == self.stack_bottom[ei]:
+                self.ref[Q.right_low] = self.lowpt_edge[e]
+            if (S[-1] if S else None) is self.stack_bottom[ei]:
                 break
         # merge conflicting return edges of e_1,...,e_i-1 into P.L
-        while top_of_stack(self.S).left.conflicting(ei, self) or top_of_stack(
-            self.S
-        ).right.conflicting(ei, self):
-            Q = self.S.pop()
-            if Q.right.conflicting(ei, self):
+        while S[-1].left_conflicting(ei, self) or S[-1].right_conflicting(ei, self):
+            Q = S.pop()
+            if Q.right_conflicting(ei, self):
                 Q.swap()
-            if Q.right.conflicting(ei, self):  # not planar
+            if Q.right_conflicting(ei, self):  # not planar
                 return False
             # merge interval below lowpt(e_i) into P.R
-            self.ref[P.right.low] = Q.right.high
-            if Q.right.low is not None:
-                P.right.low = Q.right.low
+            self.ref[P.right_low] = Q.right_high
+            if Q.right_low is not None:
+                P.right_low = Q.right_low
 
-            if P.left.empty():  # topmost interval
-                P.left = Q.left.copy()
+            if P.left_empty():  # topmost interval
+                P.left_high = Q.left_high
             else:
-                self.ref[P.left.low] = Q.left.high
-            P.left.low = Q.left.low
+                self.ref[P.left_low] = Q.left_high
+            P.left_low = Q.left_low
 
-        if not (P.left.empty() and P.right.empty()):
-            self.S.append(P)
+        if not (P.left_empty() and P.right_empty()):
+            S.append(P)
         return True
 
     def remove_back_edges(self, e):
-        u = e[0]
+        S = self.S
+        u = self.source[e]
         # trim back edges ending at parent u
         # drop entire conflict pairs
-        while self.S and top_of_stack(self.S).lowest(self) == self.height[u]:
-            P = self.S.pop()
-            if P.left.low is not None:
-                self.side[P.left.low] = -1
+        while S and S[-1].lowest(self) == self.height[u]:
+            P = S.pop()
+            if P.left_low is not None:
+                self.side[P.left_low] = -1
 
-        if self.S:  # one more conflict pair to consider
-            P = self.S.pop()
+        if S:  # one more conflict pair to consider
+            P = S.pop()
             # trim left interval
-            while P.left.high is not None and P.left.high[1] == u:
-                P.left.high = self.ref[P.left.high]
-            if P.left.high is None and P.left.low is not None:
+            while P.left_high is not None and self.target[P.left_high] == u:
+                P.left_high = self.ref[P.left_high]
+            if P.left_high is None and P.left_low is not None:
                 # just emptied
-                self.ref[P.left.low] = P.right.low
-                self.side[P.left.low] = -1
-                P.left.low = None
+                self.ref[P.left_low] = P.right_low
+                self.side[P.left_low] = -1
+                P.left_low = None
             # trim right interval
-            while P.right.high is not None and P.right.high[1] == u:
-                P.right.high = self.ref[P.right.high]
-            if P.right.high is None and P.right.low is not None:
+            while P.right_high is not None and self.target[P.right_high] == u:
+                P.right_high = self.ref[P.right_high]
+            if P.right_high is None and P.right_low is not None:
                 # just emptied
-                self.ref[P.right.low] = P.left.low
-                self.side[P.right.low] = -1
-                P.right.low = None
-            self.S.append(P)
+                self.ref[P.right_low] = P.left_low
+                self.side[P.right_low] = -1
+                P.right_low = None
+            S.append(P)
 
         # side of e is side of a highest return edge
         if self.lowpt[e] < self.height[u]:  # e has return edge
-            hl = top_of_stack(self.S).left.high
-            hr = top_of_stack(self.S).right.high
+            hl = S[-1].left_high
+            hr = S[-1].right_high
 
             if hl is not None and (hr is None or self.lowpt[hl] > self.lowpt[hr]):
                 self.ref[e] = hl
@@ -637,70 +797,70 @@ class LRPlanarity:
 
     def dfs_embedding(self, v):
         """Completes the embedding."""
+        target = self.target
         # the recursion stack
         dfs_stack = [v]
-        # index of next edge to handle in adjacency list of each node
-        ind = defaultdict(lambda: 0)
+        # iterator over the remaining edges in adjacency list of each node
+        out_edges = {v: iter(self.ordered_adjs[v])}
 
         while dfs_stack:
             v = dfs_stack.pop()
 
-            for w in self.ordered_adjs[v][ind[v] :]:
-                ind[v] += 1
-                ei = (v, w)
+            for ei in out_edges[v]:
+                w = target[ei]
 
                 if ei == self.parent_edge[w]:  # tree edge
-                    self.embedding.add_half_edge_first(w, v)
+                    self.add_half_edge_first(w, v)
                     self.left_ref[v] = w
                     self.right_ref[v] = w
 
+                    out_edges[w] = iter(self.ordered_adjs[w])
                     dfs_stack.append(v)  # revisit v after finishing w
                     dfs_stack.append(w)  # visit w next
                     break  # handle next node in dfs_stack (i.e. w)
                 else:  # back edge
                     if self.side[ei] == 1:
-                        self.embedding.add_half_edge_cw(w, v, self.right_ref[w])
+                        self.add_half_edge_cw(w, v, self.right_ref[w])
                     else:
-                        self.embedding.add_half_edge_ccw(w, v, self.left_ref[w])
+                        self.add_half_edge_ccw(w, v, self.left_ref[w])
                         self.left_ref[w] = v
 
     def dfs_embedding_recursive(self, v):
         """Recursive version of :meth:`dfs_embedding`."""
-        for w in self.ordered_adjs[v]:
-            ei = (v, w)
+        for ei in self.ordered_adjs[v]:
+            w = self.target[ei]
             if ei == self.parent_edge[w]:  # tree edge
-                self.embedding.add_half_edge_first(w, v)
+                self.add_half_edge_first(w, v)
                 self.left_ref[v] = w
                 self.right_ref[v] = w
                 self.dfs_embedding_recursive(w)
             else:  # back edge
                 if self.side[ei] == 1:
                     # place v directly after right_ref[w] in embed. list of w
-                    self.embedding.add_half_edge_cw(w, v, self.right_ref[w])
+                    self.add_half_edge_cw(w, v, self.right_ref[w])
                 else:
                     # place v directly before left_ref[w] in embed. list of w
-                    self.embedding.add_half_edge_ccw(w, v, self.left_ref[w])
+                    self.add_half_edge_ccw(w, v, self.left_ref[w])
                     self.left_ref[w] = v
 
     def sign(self, e):
         """Resolve the relative side of an edge to the absolute side."""
-        # the recursion stack
-        dfs_stack = [e]
-        # dict to remember reference edges
-        old_ref = defaultdict(lambda: None)
-
-        while dfs_stack:
-            e = dfs_stack.pop()
-
-            if self.ref[e] is not None:
-                dfs_stack.append(e)  # revisit e after finishing self.ref[e]
-                dfs_stack.append(self.ref[e])  # visit self.ref[e] next
-                old_ref[e] = self.ref[e]  # remember value of self.ref[e]
-                self.ref[e] = None
-            else:
-                self.side[e] *= self.side[old_ref[e]]
-
-        return self.side[e]
+        ref = self.ref
+        side = self.side
+        # follow the references to an edge whose side is absolute
+        chain = []
+        while ref[e] is not None:
+            chain.append(e)
+            e = ref[e]
+
+        # resolve the sides backwards and drop the resolved references
+        s = side[e]
+        for e in reversed(chain):
+            s *= side[e]
+            side[e] = s
+            ref[e] = None
+
+        return s
 
     def sign_recursive(self, e):
         """Recursive version of :meth:`sign`."""
@@ -843,15 +1003,16 @@ class PlanarEmbedding(nx.DiGraph):
         node
 
         """
-        if len(self[v]) == 0:
+        nbrs = self._succ[v]
+        if len(nbrs) == 0:
             # v has no neighbors
             return
-        start_node = self.nodes[v]["first_nbr"]
+        start_node = self._node[v]["first_nbr"]
         yield start_node
-        current_node = self[v][start_node]["cw"]
+        current_node = nbrs[start_node]["cw"]
         while start_node != current_node:
             yield current_node
-            current_node = self[v][current_node]["cw"]
+            current_node = nbrs[current_node]["cw"]
 
     def check_structure(self):
         """Runs without exceptions if this object is valid.
@@ -872,45 +1033,63 @@ class PlanarEmbedding(nx.DiGraph):
             PlanarEmbedding is invalid.
         """
         # Check fundamental structure
-        for v in self:
+        succ = self._succ
+        for v, nbrs in succ.items():
             try:
-                sorted_nbrs = set(self.neighbors_cw_order(v))
+                # Each step of the cw order reads a distinct neighbor from
+                # nbrs, so it covers all of them iff it has len(nbrs) steps.
+                num_sorted_nbrs = sum(1 for _ in self.neighbors_cw_order(v))
             except KeyError as e:
                 msg = f"Bad embedding. Missing orientation for a neighbor of {v}"
                 raise nx.NetworkXException(msg) from e
 
-            unsorted_nbrs = set(self[v])
-            if sorted_nbrs != unsorted_nbrs:
+            if num_sorted_nbrs != len(nbrs):
                 msg = "Bad embedding. Edge orientations not set correctly."
                 raise nx.NetworkXException(msg)
-            for w in self[v]:
+            for w in nbrs:
                 # Check if opposite half-edge exists
-                if not self.has_edge(w, v):
+                if v not in succ[w]:
                     msg = "Bad embedding. Opposite half-edge is missing."
                     raise nx.NetworkXException(msg)
 
         # Check planarity
+        # If all nodes are small nonnegative ints a half-edge (v, w) is
+        # marked as the single int (v << 32) | w instead of a 2-tuple.
+        packed = all(type(v) is int and 0 <= v < 1 << 32 for v in self)
         counted_half_edges = set()
-        for component in nx.connected_components(self):
-            if len(component) == 1:
+        euler_msg = "Bad embedding. The graph does not match Euler's formula"
+        seen = set()
+        for start in succ:
+            if start in seen or not succ[start]:
                 # Don't need to check single node component
                 continue
+            # Collect the component of start by a BFS over the raw adjacency
+            # (every half-edge has its opposite, so successors are enough)
+            seen.add(start)
+            component = [start]
+            for v in component:
+                for w in succ[v]:
+                    if w not in seen:
+                        seen.add(w)
+                        component.append(w)
             num_nodes = len(component)
-            num_half_edges = 0
+            # The cw order of each node was checked to hold all its neighbors
+            num_edges = sum(len(succ[v]) for v in component) // 2
+            if num_nodes > 2 and num_edges > 3 * num_nodes - 6:
+                # Too many edges for any planar embedding, as in the LR test
+                raise nx.NetworkXException(euler_msg)
             num_faces = 0
             for v in component:
                 for w in self.neighbors_cw_order(v):
-                    num_half_edges += 1
-                    if (v, w) not in counted_half_edges:
+                    half_edge = (v << 32) | w if packed else (v, w)
+                    if half_edge not in counted_half_edges:
                         # We encountered a new face
                         num_faces += 1
                         # Mark all half-edges belonging to this face
-                        self.traverse_face(v, w, counted_half_edges)
-            num_edges = num_half_edges // 2  # num_half_edges is even
+                        self._traverse_face_mark_only(v, w, counted_half_edges, packed)
             if num_nodes - num_edges + num_faces != 2:
                 # The result does not match Euler's formula
-                msg = "Bad embedding. The graph does not match Euler's formula"
-                raise nx.NetworkXException(msg)
+                raise nx.NetworkXException(euler_msg)
 
     def add_half_edge_ccw(self, start_node, end_node, reference_neighbor):
         """Adds a half-edge from start_node to end_node.
@@ -941,17 +1120,16 @@ class PlanarEmbedding(nx.DiGraph):
         """
         if reference_neighbor is None:
             # The start node has no neighbors
-            self.add_edge(start_node, end_node)  # Add edge to graph
-            self[start_node][end_node]["cw"] = end_node
-            self[start_node][end_node]["ccw"] = end_node
-            self.nodes[start_node]["first_nbr"] = end_node
+            self.add_edge(start_node, end_node, cw=end_node, ccw=end_node)
+            self._node[start_node]["first_nbr"] = end_node
         else:
-            ccw_reference = self[start_node][reference_neighbor]["ccw"]
+            ccw_reference = self._succ[start_node][reference_neighbor]["ccw"]
             self.add_half_edge_cw(start_node, end_node, ccw_reference)
 
-            if reference_neighbor == self.nodes[start_node].get("first_nbr", None):
+            node_data = self._node[start_node]
+            if reference_neighbor == node_data.get("first_nbr", None):
                 # Update first neighbor
-                self.nodes[start_node]["first_nbr"] = end_node
+                node_data["first_nbr"] = end_node
 
     def add_half_edge_cw(self, start_node, end_node, reference_neighbor):
         """Adds a half-edge from start_node to end_node.
@@ -980,26 +1158,29 @@ class PlanarEmbedding(nx.DiGraph):
         add_half_edge_first
         """
         self.add_edge(start_node, end_node)  # Add edge to graph
+        nbrs = self._succ[start_node]
+        new_attrs = nbrs[end_node]
 
         if reference_neighbor is None:
             # The start node has no neighbors
-            self[start_node][end_node]["cw"] = end_node
-            self[start_node][end_node]["ccw"] = end_node
-            self.nodes[start_node]["first_nbr"] = end_node
+            new_attrs["cw"] = end_node
+            new_attrs["ccw"] = end_node
+            self._node[start_node]["first_nbr"] = end_node
             return
 
-        if reference_neighbor not in self[start_node]:
+        if reference_neighbor not in nbrs:
             raise nx.NetworkXException(
                 "Cannot add edge. Reference neighbor does not exist"
             )
 
+        ref_attrs = nbrs[reference_neighbor]
         # Get half-edge at the other side
-        cw_reference = self[start_node][reference_neighbor]["cw"]
+        cw_reference = ref_attrs["cw"]
         # Alter half-edge data structures
-        self[start_node][reference_neighbor]["cw"] = end_node
-        self[start_node][end_node]["cw"] = cw_reference
-        self[start_node][cw_reference]["ccw"] = end_node
-        self[start_node][end_node]["ccw"] = reference_neighbor
+        ref_attrs["cw"] = end_node
+        new_attrs["cw"] = cw_reference
+        nbrs[cw_reference]["ccw"] = end_node
+        new_attrs["ccw"] = reference_neighbor
 
     def connect_components(self, v, w):
         """Adds half-edges for (v, w) and (w, v) at some position.
@@ -1039,12 +1220,28 @@ class PlanarEmbedding(nx.DiGraph):
         add_half_edge_cw
         connect_components
         """
-        if start_node in self and "first_nbr" in self.nodes[start_node]:
-            reference = self.nodes[start_node]["first_nbr"]
+        if start_node in self._node:
+            reference = self._node[start_node].get("first_nbr")
         else:
             reference = None
         self.add_half_edge_ccw(start_node, end_node, reference)
 
+    def _set_cw_order(self, start_node, end_nodes):
+        """Adds the half-edges from start_node to end_nodes in clockwise order.
+
+        start_node must already be in the embedding and have no neighbors.
+        The orientation attributes of all half-edges are written directly
+        instead of going through :meth:`add_half_edge_cw` for each of them.
+        """
+        succ = self._succ[start_node]
+        pred = self._pred
+        num_nbrs = len(end_nodes)
+        for i, end_node in enumerate(end_nodes):
+            datadict = {"cw": end_nodes[(i + 1) % num_nbrs], "ccw": end_nodes[i - 1]}
+            succ[end_node] = datadict
+            pred[end_node][start_node] = datadict
+        self._node[start_node]["first_nbr"] = end_nodes[0]
+
     def next_face_half_edge(self, v, w):
         """Returns the following half-edge left of a face.
 
@@ -1057,7 +1254,7 @@ class PlanarEmbedding(nx.DiGraph):
         -------
         half-edge : tuple
         """
-        new_node = self[w][v]["ccw"]
+        new_node = self._succ[w][v]["ccw"]
         return w, new_node
 
     def traverse_face(self, v, w, mark_half_edges=None):
@@ -1092,7 +1289,7 @@ class PlanarEmbedding(nx.DiGraph):
         prev_node = v
         cur_node = w
         # Last half-edge is (incoming_node, v)
-        incoming_node = self[v][w]["cw"]
+        incoming_node = self._succ[v][w]["cw"]
 
         while cur_node != v or prev_node != incoming_node:
             face_nodes.append(cur_node)
@@ -1103,6 +1300,31 @@ class PlanarEmbedding(nx.DiGraph):
 
         return face_nodes
 
+    def _traverse_face_mark_only(self, v, w, mark_half_edges, packed=False):
+        """Adds the half-edges on the face of (v, w) to `mark_half_edges`.
+
+        Walks the same face as :meth:`traverse_face` without collecting
+        its nodes. If `packed` is True, the nodes must be ints below 2**32
+        and each half-edge (x, y) is marked as ``(x << 32) | y``.
+        """
+        succ = self._succ
+        mark_half_edges.add((v << 32) | w if packed else (v, w))
+        prev_node = v
+        cur_node = w
+        # Last half-edge is (incoming_node, v)
+        incoming_node = succ[v][w]["cw"]
+
+        while cur_node != v or prev_node != incoming_node:
+            # The step of next_face_half_edge, without the method call
+            prev_node, cur_node = cur_node, succ[cur_node][prev_node]["ccw"]
+            if packed:
+                half_edge = (prev_node << 32) | cur_node
+            else:
+                half_edge = (prev_node, cur_node)
+            if half_edge in mark_half_edges:
+                raise nx.NetworkXException("Bad planar embedding. Impossible face.")
+            mark_half_edges.add(half_edge)
+
     def is_directed(self):
         """A valid PlanarEmbedding is undirected.
 
@@ -6,7 +6,7 @@ from itertools import count
 import graphnetworkx as nx
 from graphnetworkx.algorithms.shortest_paths.weighted import _weight_function
 
-__all__ = ["astar_path", "astar_path_length"]
+__all__ = ["astar_path", "astar_path_length", "bidirectional_astar_path"]
 
 
 def astar_path(G, source, target, heuristic=None, weight="weight"):
@@ -71,6 +71,15 @@ def astar_path(G, source, target, heuristic=None, weight="weight"):
         msg = f"Either source {source} or target {target} is not in G"
         raise nx.NodeNotFound(msg)
 
+    return _astar_path(G, source, target, heuristic, weight)
+
+
+def _astar_path(G, source, target, heuristic, weight):
+    """Uses A* to find a shortest path from source to target.
+
+    Like :func:`astar_path`, but both nodes must already be known to be
+    in `G`.
+    """
     if heuristic is None:
         # The default heuristic is h=0 - same as Dijkstra's algorithm
         def heuristic(u, v):
@@ -78,7 +87,14 @@ def astar_path(G, source, target, heuristic=None, weight="weight"):
 
     push = heappush
     pop = heappop
-    weight = _weight_function(G, weight)
+    if isinstance(weight, str) and not G.is_multigraph():
+        # Read the edge attribute inline instead of calling a weight function
+        weight_key = weight
+    else:
+        weight_key = None
+        weight = _weight_function(G, weight)
+
+    G_succ = G._succ if G.is_directed() else G._adj
 
     # The queue stores priority, node, cost to reach, and parent.
     # Uses Python heapq to keep in priority order.
@@ -120,10 +136,15 @@ def astar_path(G, source, target, heuristic=None, weight="weight"):
 
         explored[curnode] = parent
 
-        for neighbor, w in G[curnode].items():
-            ncost = dist + weight(curnode, neighbor, w)
-            if neighbor in enqueued:
-                qcost, h = enqueued[neighbor]
+        for neighbor, w in G_succ[curnode].items():
+            if weight_key is None:
+                ncost = dist + weight(curnode, neighbor, w)
+            else:
+                ncost = dist + w.get(weight_key, 1)
+            # look the neighbor up only once
+            queued = enqueued.get(neighbor)
+            if queued is not None:
+                qcost, h = queued
                 # if qcost <= ncost, a less costly path from the
                 # neighbor to the source was already determined.
                 # Therefore, we won't attempt to push this neighbor
@@ -182,6 +203,176 @@ def astar_path_length(G, source, target, heuristic=None, weight="weight"):
         msg = f"Either source {source} or target {target} is not in G"
         raise nx.NodeNotFound(msg)
 
+    path = _astar_path(G, source, target, heuristic, weight)
     weight = _weight_function(G, weight)
-    path = astar_path(G, source, target, heuristic, weight)
-    return sum(weight(u, v, G[u][v]) for u, v in zip(path[:-1], path[1:]))
+    G_succ = G._adj
+    return sum(weight(u, v, G_succ[u][v]) for u, v in zip(path[:-1], path[1:]))
+
+
+def bidirectional_astar_path(G, source, target, heuristic=None, weight="weight"):
+    """Returns a list of nodes in a shortest path between source and target
+    using a bidirectional A* ("A-star") search.
+
+    The search grows one tree forward from the source and one backward
+    from the target, alternating between them, and stops once a node
+    has been settled from both sides. On long paths this usually
+    explores far fewer nodes than :func:`astar_path`.
+
+    Both searches are guided by the average potential
+    ``p(v) = (heuristic(v, target) - heuristic(source, v)) / 2``, so
+    `heuristic` is called with the source as its first argument as well
+    as with the target as its second argument. It must be consistent
+    (``heuristic(u, x) <= w(u, v) + heuristic(v, x)`` for every edge
+    ``(u, v)`` and ``heuristic(x, v) <= heuristic(x, u) + w(u, v)``),
+    otherwise the returned path may not be a shortest one. Symmetric
+    metric heuristics like the euclidean distance satisfy this.
+
+    There may be more than one shortest path.  This returns only one.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for path
+
+    target : node
+       Ending node for path
+
+    heuristic : function
+       A function to evaluate the estimate of the distance
+       between two nodes.  The function takes two nodes arguments
+       and must return a number.
+
+    weight : string or function
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number.
+
+    Raises
+    ------
+    NodeNotFound
+        If either `source` or `target` is not in `G`.
+
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> print(nx.bidirectional_astar_path(G, 0, 4))
+    [0, 1, 2, 3, 4]
+    >>> G = nx.grid_graph(dim=[3, 3])  # nodes are two-tuples (x,y)
+    >>> nx.set_edge_attributes(G, {e: e[1][0] * 2 for e in G.edges()}, "cost")
+    >>> def dist(a, b):
+    ...     (x1, y1) = a
+    ...     (x2, y2) = b
+    ...     return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+    >>> path = nx.bidirectional_astar_path(G, (0, 0), (2, 2), dist, "cost")
+    >>> print(path)
+    [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
+
+    See Also
+    --------
+    astar_path, bidirectional_dijkstra
+
+    """
+    if source not in G or target not in G:
+        msg = f"Either source {source} or target {target} is not in G"
+        raise nx.NodeNotFound(msg)
+
+    if source == target:
+        return [source]
+
+    if heuristic is None:
+        # The default heuristic is h=0 - same as bidirectional Dijkstra
+        def heuristic(u, v):
+            return 0
+
+    push = heappush
+    pop = heappop
+    weight = _weight_function(G, weight)
+
+    if G.is_directed():
+        neighs = [G._succ, G._pred]
+    else:
+        neighs = [G._adj, G._adj]
+
+    # Both directions run Dijkstra on the edge weights reduced by the
+    # potential, w(u, v) - p(u) + p(v), which is nonnegative for a
+    # consistent heuristic. Every source-target path is shifted by the
+    # same constant, so shortest paths are preserved.
+    potentials = {}
+
+    def potential(v):
+        pv = potentials.get(v)
+        if pv is None:
+            pv = (heuristic(v, target) - heuristic(source, v)) / 2
+            potentials[v] = pv
+        return pv
+
+    # dists[0] and dists[1] hold the settled (reduced) distances from
+    # the source and to the target, and seen the best ones found so far.
+    dists = [{}, {}]
+    seen = [{source: 0}, {target: 0}]
+    # Maps discovered nodes to their parent towards source or target
+    parents = [{source: None}, {target: None}]
+    c = count()
+    fringe = [[(0, next(c), source)], [(0, next(c), target)]]
+    # The best path length through a node reached from both sides
+    # (mu) and that meeting node
+    best = None
+    meet = None
+
+    dir = 1
+    while fringe[0] and fringe[1]:
+        # choose direction, dir == 0 is forward direction and dir == 1 is back
+        dir = 1 - dir
+        dist, _, v = pop(fringe[dir])
+        if v in dists[dir]:
+            # Shortest path to v has already been found
+            continue
+        dists[dir][v] = dist
+        if v in dists[1 - dir]:
+            # v has been settled from both sides: no path through an
+            # unsettled node can be shorter than best.
+            path = []
+            node = meet
+            while node is not None:
+                path.append(node)
+                node = parents[0][node]
+            path.reverse()
+            node = parents[1][meet]
+            while node is not None:
+                path.append(node)
+                node = parents[1][node]
+            return path
+
+        pv = potential(v)
+        seendir = seen[dir]
+        seenother = seen[1 - dir]
+        for w, d in neighs[dir][v].items():
+            if w in dists[dir]:
+                continue
+            if dir == 0:
+                vw_dist = dist + weight(v, w, d) - pv + potential(w)
+            else:
+                vw_dist = dist + weight(w, v, d) + pv - potential(w)
+            if w not in seendir or vw_dist < seendir[w]:
+                seendir[w] = vw_dist
+                parents[dir][w] = v
+                push(fringe[dir], (vw_dist, next(c), w))
+                if w in seenother:
+                    total = vw_dist + seenother[w]
+                    if best is None or total < best:
+                        best = total
+                        meet = w
+
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
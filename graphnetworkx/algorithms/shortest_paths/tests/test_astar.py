@@ -153,6 +153,13 @@ class TestAStar:
         assert nx.astar_path(G, "s", "v") == ["s", "u", "v"]
         assert nx.astar_path_length(G, "s", "v") == 2
 
+    def test_astar_weight_function(self):
+        def w(u, v, d):
+            return d["weight"] if u != "x" else 100
+
+        assert nx.astar_path(self.XG, "s", "v", weight=w) == ["s", "u", "v"]
+        assert nx.astar_path_length(self.XG, "s", "v", weight=w) == 11
+
     def test_astar_nopath(self):
         with pytest.raises(nx.NodeNotFound):
             nx.astar_path(self.XG, "s", "moon")
@@ -175,3 +182,64 @@ class TestAStar:
         G.add_edges_from(pairwise(nodes, cyclic=True))
         path = nx.astar_path(G, nodes[0], nodes[2])
         assert len(path) == 3
+
+
+class TestBidirectionalAStar:
+    @classmethod
+    def setup_class(cls):
+        edges = [
+            ("s", "u", 10),
+            ("s", "x", 5),
+            ("u", "v", 1),
+            ("u", "x", 2),
+            ("v", "y", 1),
+            ("x", "u", 3),
+            ("x", "v", 5),
+            ("x", "y", 2),
+            ("y", "s", 7),
+            ("y", "v", 6),
+        ]
+        cls.XG = nx.DiGraph()
+        cls.XG.add_weighted_edges_from(edges)
+
+    def test_bidirectional_astar_directed(self):
+        assert nx.bidirectional_astar_path(self.XG, "s", "v") == ["s", "x", "u", "v"]
+        assert nx.bidirectional_astar_path(self.XG, "v", "s") == ["v", "y", "s"]
+
+    def test_bidirectional_astar_undirected(self):
+        G = nx.Graph()
+        edges = [(0, 1, 2), (1, 2, 12), (2, 3, 1), (3, 4, 5), (4, 5, 1), (5, 0, 10)]
+        G.add_weighted_edges_from(edges)
+        assert nx.bidirectional_astar_path(G, 0, 3) == [0, 1, 2, 3]
+
+    def test_bidirectional_astar_grid(self):
+        G = nx.grid_2d_graph(12, 12)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = 1 + (u[0] * 7 + v[1] * 3) % 5
+
+        def dist(a, b):
+            x1, y1 = a
+            x2, y2 = b
+            return abs(x1 - x2) + abs(y1 - y2)
+
+        for source, target in [((0, 0), (11, 11)), ((3, 9), (10, 0))]:
+            path = nx.bidirectional_astar_path(G, source, target, dist)
+            assert path[0] == source
+            assert path[-1] == target
+            length = nx.path_weight(G, path, "weight")
+            assert length == nx.dijkstra_path_length(G, source, target)
+
+    def test_bidirectional_astar_multigraph(self):
+        G = nx.MultiDiGraph(self.XG)
+        G.add_weighted_edges_from((u, v, 1000) for (u, v) in list(G.edges()))
+        assert nx.bidirectional_astar_path(G, "s", "v") == ["s", "x", "u", "v"]
+
+    def test_bidirectional_astar_source_is_target(self):
+        assert nx.bidirectional_astar_path(self.XG, "s", "s") == ["s"]
+
+    def test_bidirectional_astar_nopath(self):
+        G = nx.DiGraph([(0, 1), (2, 1)])
+        with pytest.raises(nx.NetworkXNoPath):
+            nx.bidirectional_astar_path(G, 0, 2)
+        with pytest.raises(nx.NodeNotFound):
+            nx.bidirectional_astar_path(self.XG, "s", "moon")
@@ -14,3 +14,14 @@ def test_get_moral_graph():
     assert H.has_edge(6, 7)
     assert H.has_edge(4, 7)
     assert not H.has_edge(1, 5)
+
+
+def test_moral_graph_multidigraph():
+    graph = nx.MultiDiGraph()
+    graph.add_edges_from([(1, 3), (2, 3), (1, 4), (2, 4), (1, 4)])
+    H = moral_graph(graph)
+    assert H.is_multigraph()
+    # one moralizing edge between the parents for each of the two children
+    assert H.number_of_edges(1, 2) == 2
+    assert H.number_of_edges(1, 4) == 2
+    assert H.number_of_edges() == 7
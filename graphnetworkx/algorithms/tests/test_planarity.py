@@ -103,6 +103,12 @@ class TestLRPlanarity:
         G.add_edges_from([(6, 7), (7, 8), (8, 6)])
         self.check_graph(G, is_planar=False)
 
+    def test_dense_component_with_isolated_nodes(self):
+        # the whole graph satisfies the edge bound, but K5 does not
+        G = nx.complete_graph(5)
+        G.add_nodes_from(range(5, 20))
+        self.check_graph(G, is_planar=False)
+
     def test_non_planar_with_selfloop(self):
         G = nx.complete_graph(5)
         # add self loops
@@ -375,6 +381,16 @@ class TestPlanarEmbeddingClass:
         data_cmp = {0: [2, 1], 1: [0], 2: [0]}
         assert data == data_cmp
 
+    def test_set_cw_order(self):
+        embedding = nx.PlanarEmbedding()
+        embedding.add_nodes_from(range(4))
+        embedding._set_cw_order(0, [1, 3, 2])
+        for i in range(1, 4):
+            embedding._set_cw_order(i, [0])
+        embedding.check_structure()
+        assert embedding.get_data() == {0: [1, 3, 2], 1: [0], 2: [0], 3: [0]}
+        assert embedding[0][1]["ccw"] == 2
+
     def test_missing_edge_orientation(self):
         with pytest.raises(nx.NetworkXException):
             embedding = nx.PlanarEmbedding()
@@ -407,6 +423,28 @@ class TestPlanarEmbeddingClass:
                         embedding.add_half_edge_first(i, j)
             embedding.check_structure()
 
+    def test_non_planar_rotation_system(self):
+        # K4 is planar, but this cw order embeds it on a torus
+        embedding = nx.PlanarEmbedding()
+        embedding.set_data({0: [1, 2, 3], 1: [0, 2, 3], 2: [0, 1, 3], 3: [0, 1, 2]})
+        with pytest.raises(nx.NetworkXException, match="Euler"):
+            embedding.check_structure()
+
+    @pytest.mark.parametrize("nodes", [range(5), range(-2, 3), ["a", 1, 2, 3, 4]])
+    def test_check_structure_node_labels(self, nodes):
+        # Small nonnegative int labels take the packed half-edge path
+        G = nx.complete_graph(nodes)
+        G.remove_edge(*list(G.edges)[0])
+        is_planar, embedding = nx.check_planarity(G)
+        assert is_planar
+        embedding.check_structure()
+        for i in nodes:
+            for j in nodes:
+                if i != j and not embedding.has_edge(i, j):
+                    embedding.add_half_edge_first(i, j)
+        with pytest.raises(nx.NetworkXException, match="Euler"):
+            embedding.check_structure()
+
     def test_missing_reference(self):
         with pytest.raises(nx.NetworkXException):
             embedding = nx.PlanarEmbedding()
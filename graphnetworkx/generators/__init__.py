@@ -2,30 +2,183 @@
 A package for generating various graphs in networkx.
 
 """
-from graphnetworkx.generators.atlas import *
-from graphnetworkx.generators.classic import *
-from graphnetworkx.generators.cographs import *
-from graphnetworkx.generators.community import *
-from graphnetworkx.generators.degree_seq import *
-from graphnetworkx.generators.directed import *
-from graphnetworkx.generators.duplication import *
-from graphnetworkx.generators.ego import *
-from graphnetworkx.generators.expanders import *
-from graphnetworkx.generators.geometric import *
-from graphnetworkx.generators.internet_as_graphs import *
-from graphnetworkx.generators.intersection import *
-from graphnetworkx.generators.interval_graph import *
-from graphnetworkx.generators.joint_degree_seq import *
-from graphnetworkx.generators.lattice import *
-from graphnetworkx.generators.line import *
-from graphnetworkx.generators.mycielski import *
-from graphnetworkx.generators.nonisomorphic_trees import *
-from graphnetworkx.generators.random_clustered import *
-from graphnetworkx.generators.random_graphs import *
-from graphnetworkx.generators.small import *
-from graphnetworkx.generators.social import *
-from graphnetworkx.generators.sudoku import *
-from graphnetworkx.generators.spectral_graph_forge import *
-from graphnetworkx.generators.stochastic import *
-from graphnetworkx.generators.trees import *
-from graphnetworkx.generators.triads import *
+
+# The submodules are imported on first access to one of their names
+# (PEP 562). This maps each of them to its ``__all__``.
+_submodule_names = {
+    "atlas": ("graph_atlas", "graph_atlas_g"),
+    "classic": (
+        "balanced_tree",
+        "barbell_graph",
+        "binomial_tree",
+        "complete_graph",
+        "complete_multipartite_graph",
+        "circular_ladder_graph",
+        "circulant_graph",
+        "cycle_graph",
+        "dorogovtsev_goltsev_mendes_graph",
+        "empty_graph",
+        "full_rary_tree",
+        "ladder_graph",
+        "lollipop_graph",
+        "null_graph",
+        "path_graph",
+        "star_graph",
+        "trivial_graph",
+        "turan_graph",
+        "wheel_graph",
+    ),
+    "cographs": ("random_cograph",),
+    "community": (
+        "caveman_graph",
+        "connected_caveman_graph",
+        "relaxed_caveman_graph",
+        "random_partition_graph",
+        "planted_partition_graph",
+        "gaussian_random_partition_graph",
+        "ring_of_cliques",
+        "windmill_graph",
+        "stochastic_block_model",
+        "LFR_benchmark_graph",
+    ),
+    "degree_seq": (
+        "configuration_model",
+        "directed_configuration_model",
+        "expected_degree_graph",
+        "havel_hakimi_graph",
+        "directed_havel_hakimi_graph",
+        "degree_sequence_tree",
+        "random_degree_sequence_graph",
+    ),
+    "directed": (
+        "gn_graph",
+        "gnc_graph",
+        "gnr_graph",
+        "random_k_out_graph",
+        "scale_free_graph",
+    ),
+    "duplication": ("partial_duplication_graph", "duplication_divergence_graph"),
+    "ego": ("ego_graph",),
+    "expanders": ("margulis_gabber_galil_graph", "chordal_cycle_graph", "paley_graph"),
+    "geometric": (
+        "geographical_threshold_graph",
+        "waxman_graph",
+        "navigable_small_world_graph",
+        "random_geometric_graph",
+        "soft_random_geometric_graph",
+        "thresholded_random_geometric_graph",
+    ),
+    "internet_as_graphs": ("random_internet_as_graph",),
+    "intersection": (
+        "uniform_random_intersection_graph",
+        "k_random_intersection_graph",
+        "general_random_intersection_graph",
+    ),
+    "interval_graph": ("interval_graph",),
+    "joint_degree_seq": (
+        "is_valid_joint_degree",
+        "is_valid_directed_joint_degree",
+        "joint_degree_graph",
+        "directed_joint_degree_graph",
+    ),
+    "lattice": (
+        "grid_2d_graph",
+        "grid_graph",
+        "hypercube_graph",
+        "triangular_lattice_graph",
+        "hexagonal_lattice_graph",
+    ),
+    "line": ("line_graph", "inverse_line_graph"),
+    "mycielski": ("mycielskian", "mycielski_graph"),
+    "nonisomorphic_trees": ("nonisomorphic_trees", "number_of_nonisomorphic_trees"),
+    "random_clustered": ("random_clustered_graph",),
+    "random_graphs": (
+        "fast_gnp_random_graph",
+        "gnp_random_graph",
+        "dense_gnm_random_graph",
+        "gnm_random_graph",
+        "erdos_renyi_graph",
+        "binomial_graph",
+        "newman_watts_strogatz_graph",
+        "watts_strogatz_graph",
+        "connected_watts_strogatz_graph",
+        "random_regular_graph",
+        "barabasi_albert_graph",
+        "dual_barabasi_albert_graph",
+        "extended_barabasi_albert_graph",
+        "powerlaw_cluster_graph",
+        "random_lobster",
+        "random_shell_graph",
+        "random_powerlaw_tree",
+        "random_powerlaw_tree_sequence",
+        "random_kernel_graph",
+    ),
+    "small": (
+        "make_small_graph",
+        "LCF_graph",
+        "bull_graph",
+        "chvatal_graph",
+        "cubical_graph",
+        "desargues_graph",
+        "diamond_graph",
+        "dodecahedral_graph",
+        "frucht_graph",
+        "heawood_graph",
+        "hoffman_singleton_graph",
+        "house_graph",
+        "house_x_graph",
+        "icosahedral_graph",
+        "krackhardt_kite_graph",
+        "moebius_kantor_graph",
+        "octahedral_graph",
+        "pappus_graph",
+        "petersen_graph",
+        "sedgewick_maze_graph",
+        "tetrahedral_graph",
+        "truncated_cube_graph",
+        "truncated_tetrahedron_graph",
+        "tutte_graph",
+    ),
+    "social": (
+        "karate_club_graph",
+        "davis_southern_women_graph",
+        "florentine_families_graph",
+        "les_miserables_graph",
+    ),
+    "sudoku": ("sudoku_graph",),
+    "spectral_graph_forge": ("spectral_graph_forge",),
+    "stochastic": ("stochastic_graph",),
+    "trees": ("prefix_tree", "random_tree", "prefix_tree_recursive"),
+    "triads": ("triad_graph",),
+}
+
+_lazy_names = {
+    name: modname for modname, names in _submodule_names.items() for name in names
+}
+for _modname in _submodule_names:
+    _lazy_names.setdefault(_modname, _modname)
+
+__all__ = [name for names in _submodule_names.values() for name in names]
+
+
+def __getattr__(name):
+    """Import the generator submodule that provides `name`."""
+    modname = _lazy_names.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    import importlib
+
+    module = importlib.import_module(f"{__name__}.{modname}")
+    globals().update((attr, getattr(module, attr)) for attr in module.__all__)
+    return globals()[name]
+
+
+def __dir__():
+    return list({**globals(), **_lazy_names})
+
+
+# Importing a submodule binds it as an attribute of this package. These
+# export a function with their own name, so load them now to let the
+# function take that attribute, as the star imports did.
+for _modname in ("interval_graph", "nonisomorphic_trees", "spectral_graph_forge"):
+    __getattr__(_modname)
@@ -38,13 +38,21 @@ def stochastic_graph(G, copy=True, weight="weight"):
     """
     if copy:
         G = MultiDiGraph(G) if G.is_multigraph() else DiGraph(G)
-    # There is a tradeoff here: the dictionary of node degrees may
-    # require a lot of memory, whereas making a call to `G.out_degree`
-    # inside the loop may be costly in computation time.
-    degree = dict(G.out_degree(weight=weight))
-    for u, v, d in G.edges(data=True):
-        if degree[u] == 0:
-            d[weight] = 0
+    # Reweight the out-edges of one node at a time, like scaling the rows
+    # of the adjacency matrix by the inverse weighted out-degree.
+    multigraph = G.is_multigraph()
+    for nbrs in G._succ.values():
+        if multigraph:
+            edge_data = [d for keydict in nbrs.values() for d in keydict.values()]
         else:
-            d[weight] = d.get(weight, 1) / degree[u]
+            edge_data = nbrs.values()
+        # read each existing weight only once
+        weights = [d.get(weight, 1) for d in edge_data]
+        degree = sum(weights)
+        if degree == 0:
+            for d in edge_data:
+                d[weight] = 0
+        else:
+            for d, w in zip(edge_data, weights):
+                d[weight] = w / degree
     return G
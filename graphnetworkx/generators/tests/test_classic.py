@@ -6,6 +6,8 @@ Generators - Classic
 Unit tests for various classic graph generators in generators/classic.py
 """
 import itertools
+from collections import Counter
+from functools import lru_cache
 
 import pytest
 import graphnetworkx as nx
@@ -14,6 +16,20 @@ from graphnetworkx.utils import nodes_equal, edges_equal
 
 is_isomorphic = graph_could_be_isomorphic
 
+# Undirected edges of cycle_graph(4), normalized for set comparison
+_CYCLE4_EDGES = frozenset(map(frozenset, [(0, 1), (0, 3), (1, 2), (2, 3)]))
+
+
+@lru_cache(maxsize=None)
+def _cached_path(n):
+    """Returns a frozen path graph on n nodes to compare generators against."""
+    return nx.freeze(nx.path_graph(n))
+
+
+def _is_empty_like(G, n):
+    """Returns True if G has n nodes and no edges."""
+    return len(G) == n and G.number_of_edges() == 0
+
 
 class TestGeneratorClassic:
     def test_balanced_tree(self):
@@ -24,12 +40,12 @@ class TestGeneratorClassic:
             assert order == (r ** (h + 1) - 1) / (r - 1)
             assert nx.is_connected(t)
             assert t.size() == order - 1
-            dh = nx.degree_histogram(t)
+            dh = Counter(d for _, d in t.degree())
             assert dh[0] == 0  # no nodes of 0
             assert dh[1] == r ** h  # nodes of degree 1 are leaves
             assert dh[r] == 1  # root is degree r
             assert dh[r + 1] == order - r ** h - 1  # everyone else is degree r+1
-            assert len(dh) == r + 2
+            assert max(dh) == r + 1
 
     def test_balanced_tree_star(self):
         # balanced_tree(r,1) is the r-star
@@ -47,8 +63,9 @@ class TestGeneratorClassic:
         """
         # A tree of height four has five levels.
         T = nx.balanced_tree(1, 4)
-        P = nx.path_graph(5)
-        assert is_isomorphic(T, P)
+        P = _cached_path(5)
+        assert nodes_equal(T, P)
+        assert edges_equal(T.edges(), P.edges())
 
     def test_full_rary_tree(self):
         r = 2
@@ -56,12 +73,12 @@ class TestGeneratorClassic:
         t = nx.full_rary_tree(r, n)
         assert t.order() == n
         assert nx.is_connected(t)
-        dh = nx.degree_histogram(t)
+        dh = Counter(d for _, d in t.degree())
         assert dh[0] == 0  # no nodes of 0
         assert dh[1] == 5  # nodes of degree 1 are leaves
         assert dh[r] == 1  # root is degree r
         assert dh[r + 1] == 9 - 5 - 1  # everyone else is degree r+1
-        assert len(dh) == r + 2
+        assert max(dh) == r + 1
 
     def test_full_rary_tree_balanced(self):
         t = nx.full_rary_tree(2, 15)
@@ -70,39 +87,29 @@ class TestGeneratorClassic:
 
     def test_full_rary_tree_path(self):
         t = nx.full_rary_tree(1, 10)
-        assert is_isomorphic(t, nx.path_graph(10))
+        p = _cached_path(10)
+        assert nodes_equal(t, p)
+        assert edges_equal(t.edges(), p.edges())
 
     def test_full_rary_tree_empty(self):
         t = nx.full_rary_tree(0, 10)
-        assert is_isomorphic(t, nx.empty_graph(10))
+        assert _is_empty_like(t, 10)
         t = nx.full_rary_tree(3, 0)
-        assert is_isomorphic(t, nx.empty_graph(0))
+        assert _is_empty_like(t, 0)
 
     def test_full_rary_tree_3_20(self):
         t = nx.full_rary_tree(3, 20)
         assert t.order() == 20
 
-    def test_barbell_graph(self):
+    @pytest.mark.parametrize("m1, m2", [(3, 5), (4, 10), (3, 20)])
+    def test_barbell_graph(self, m1, m2):
         # number of nodes = 2*m1 + m2 (2 m1-complete graphs + m2-path + 2 edges)
         # number of edges = 2*(nx.number_of_edges(m1-complete graph) + m2 + 1
-        m1 = 3
-        m2 = 5
-        b = nx.barbell_graph(m1, m2)
-        assert nx.number_of_nodes(b) == 2 * m1 + m2
-        assert nx.number_of_edges(b) == m1 * (m1 - 1) + m2 + 1
-
-        m1 = 4
-        m2 = 10
-        b = nx.barbell_graph(m1, m2)
-        assert nx.number_of_nodes(b) == 2 * m1 + m2
-        assert nx.number_of_edges(b) == m1 * (m1 - 1) + m2 + 1
-
-        m1 = 3
-        m2 = 20
         b = nx.barbell_graph(m1, m2)
-        assert nx.number_of_nodes(b) == 2 * m1 + m2
-        assert nx.number_of_edges(b) == m1 * (m1 - 1) + m2 + 1
+        assert b.number_of_nodes() == 2 * m1 + m2
+        assert b.number_of_edges() == m1 * (m1 - 1) + m2 + 1
 
+    def test_barbell_graph_errors(self):
         # Raise NetworkXError if m1<2
         m1 = 1
         m2 = 20
@@ -113,64 +120,52 @@ class TestGeneratorClassic:
         m2 = -2
         pytest.raises(nx.NetworkXError, nx.barbell_graph, m1, m2)
 
-        # nx.barbell_graph(2,m) = nx.path_graph(m+4)
-        m1 = 2
-        m2 = 5
-        b = nx.barbell_graph(m1, m2)
-        assert is_isomorphic(b, nx.path_graph(m2 + 4))
-
-        m1 = 2
-        m2 = 10
-        b = nx.barbell_graph(m1, m2)
-        assert is_isomorphic(b, nx.path_graph(m2 + 4))
-
         m1 = 2
         m2 = 20
-        b = nx.barbell_graph(m1, m2)
-        assert is_isomorphic(b, nx.path_graph(m2 + 4))
-
         pytest.raises(
             nx.NetworkXError, nx.barbell_graph, m1, m2, create_using=nx.DiGraph()
         )
 
-        mb = nx.barbell_graph(m1, m2, create_using=nx.MultiGraph())
-        assert edges_equal(mb.edges(), b.edges())
+    @pytest.mark.parametrize("m2", [5, 10, 20])
+    def test_barbell_graph_path(self, m2):
+        # nx.barbell_graph(2,m) = nx.path_graph(m+4), with the same labels
+        b = nx.barbell_graph(2, m2)
+        assert edges_equal(b.edges(), _cached_path(m2 + 4).edges())
 
-    def test_binomial_tree(self):
-        graphs = (None, nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)
-        for create_using in graphs:
-            for n in range(0, 4):
-                b = nx.binomial_tree(n, create_using)
-                assert nx.number_of_nodes(b) == 2 ** n
-                assert nx.number_of_edges(b) == (2 ** n - 1)
-
-    def test_complete_graph(self):
-        # complete_graph(m) is a connected graph with
-        # m nodes and  m*(m+1)/2 edges
-        for m in [0, 1, 3, 5]:
-            g = nx.complete_graph(m)
-            assert nx.number_of_nodes(g) == m
-            assert nx.number_of_edges(g) == m * (m - 1) // 2
+        mb = nx.barbell_graph(2, m2, create_using=nx.MultiGraph())
+        assert edges_equal(mb.edges(), b.edges())
 
+    @pytest.mark.parametrize(
+        "create_using", (None, nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)
+    )
+    @pytest.mark.parametrize("n", range(4))
+    def test_binomial_tree(self, create_using, n):
+        b = nx.binomial_tree(n, create_using)
+        assert type(b) is (create_using or nx.Graph)
+        assert b.number_of_nodes() == 2 ** n
+        assert b.number_of_edges() == (2 ** n - 1)
+
+    @pytest.mark.parametrize("create_using, edge_mul", [(nx.Graph, 1), (nx.DiGraph, 2)])
+    @pytest.mark.parametrize("m", [0, 1, 3, 5])
+    def test_complete_graph(self, create_using, edge_mul, m):
+        # complete_graph(m) is a connected graph with m nodes and
+        # m*(m-1)/2 edges, twice as many when directed
+        g = nx.complete_graph(m, create_using=create_using)
+        assert g.number_of_nodes() == m
+        assert g.number_of_edges() == m * (m - 1) * edge_mul // 2
+
+    @pytest.mark.parametrize("m", [0, 1, 3, 5])
+    def test_complete_multigraph(self, m):
+        g = nx.complete_graph(m)
         mg = nx.complete_graph(m, create_using=nx.MultiGraph)
         assert edges_equal(mg.edges(), g.edges())
 
-        g = nx.complete_graph("abc")
+    @pytest.mark.parametrize("create_using, edge_mul", [(nx.Graph, 1), (nx.DiGraph, 2)])
+    def test_complete_graph_node_labels(self, create_using, edge_mul):
+        g = nx.complete_graph("abc", create_using=create_using)
         assert nodes_equal(g.nodes(), ["a", "b", "c"])
-        assert g.size() == 3
-
-    def test_complete_digraph(self):
-        # complete_graph(m) is a connected graph with
-        # m nodes and  m*(m+1)/2 edges
-        for m in [0, 1, 3, 5]:
-            g = nx.complete_graph(m, create_using=nx.DiGraph)
-            assert nx.number_of_nodes(g) == m
-            assert nx.number_of_edges(g) == m * (m - 1)
-
-        g = nx.complete_graph("abc", create_using=nx.DiGraph)
-        assert len(g) == 3
-        assert g.size() == 6
-        assert g.is_directed()
+        assert g.size() == 3 * edge_mul
+        assert g.is_directed() == (create_using is nx.DiGraph)
 
     def test_circular_ladder_graph(self):
         G = nx.circular_ladder_graph(5)
@@ -198,7 +193,7 @@ class TestGeneratorClassic:
 
     def test_cycle_graph(self):
         G = nx.cycle_graph(4)
-        assert edges_equal(G.edges(), [(0, 1), (0, 3), (1, 2), (2, 3)])
+        assert frozenset(map(frozenset, G.edges())) == _CYCLE4_EDGES
         mG = nx.cycle_graph(4, create_using=nx.MultiGraph)
         assert edges_equal(mG.edges(), [(0, 1), (0, 3), (1, 2), (2, 3)])
         G = nx.cycle_graph(4, create_using=nx.DiGraph)
@@ -222,12 +217,6 @@ class TestGeneratorClassic:
         assert edges_equal(G.edges(), [(0, 1), (0, 2), (1, 2)])
         assert nx.average_clustering(G) == 1.0
         assert sorted(nx.triangles(G).values()) == [1, 1, 1]
-        G = nx.dorogovtsev_goltsev_mendes_graph(10)
-        assert nx.number_of_nodes(G) == 29526
-        assert nx.number_of_edges(G) == 59049
-        assert G.degree(0) == 1024
-        assert G.degree(1) == 1024
-        assert G.degree(2) == 1024
 
         pytest.raises(
             nx.NetworkXError,
@@ -242,24 +231,36 @@ class TestGeneratorClassic:
             create_using=nx.MultiGraph,
         )
 
-    def test_create_using(self):
+    @pytest.mark.slow
+    def test_dorogovtsev_goltsev_mendes_graph_10(self):
+        G = nx.dorogovtsev_goltsev_mendes_graph(10)
+        assert G.number_of_nodes() == 29526
+        assert G.number_of_edges() == 59049
+        assert dict(G.degree([0, 1, 2])) == {0: 1024, 1: 1024, 2: 1024}
+
+    def test_create_using_default(self):
         G = nx.empty_graph()
         assert isinstance(G, nx.Graph)
-        pytest.raises(TypeError, nx.empty_graph, create_using=0.0)
-        pytest.raises(TypeError, nx.empty_graph, create_using="Graph")
-
-        G = nx.empty_graph(create_using=nx.MultiGraph)
-        assert isinstance(G, nx.MultiGraph)
-        G = nx.empty_graph(create_using=nx.DiGraph)
-        assert isinstance(G, nx.DiGraph)
-
-        G = nx.empty_graph(create_using=nx.DiGraph, default=nx.MultiGraph)
-        assert isinstance(G, nx.DiGraph)
-        G = nx.empty_graph(create_using=None, default=nx.MultiGraph)
-        assert isinstance(G, nx.MultiGraph)
-        G = nx.empty_graph(default=nx.MultiGraph)
-        assert isinstance(G, nx.MultiGraph)
 
+    @pytest.mark.parametrize("create_using", [0.0, "Graph"])
+    def test_create_using_invalid(self, create_using):
+        pytest.raises(TypeError, nx.empty_graph, create_using=create_using)
+
+    @pytest.mark.parametrize(
+        "kwargs, graph_type",
+        [
+            ({"create_using": nx.MultiGraph}, nx.MultiGraph),
+            ({"create_using": nx.DiGraph}, nx.DiGraph),
+            ({"create_using": nx.DiGraph, "default": nx.MultiGraph}, nx.DiGraph),
+            ({"create_using": None, "default": nx.MultiGraph}, nx.MultiGraph),
+            ({"default": nx.MultiGraph}, nx.MultiGraph),
+        ],
+    )
+    def test_create_using_class(self, kwargs, graph_type):
+        G = nx.empty_graph(**kwargs)
+        assert isinstance(G, graph_type)
+
+    def test_create_using_instance(self):
         G = nx.path_graph(5)
         H = nx.empty_graph(create_using=G)
         assert not H.is_multigraph()
@@ -267,6 +268,8 @@ class TestGeneratorClassic:
         assert len(H) == 0
         assert G is H
 
+    def test_create_using_multigraph_instance(self):
+        G = nx.path_graph(5)
         H = nx.empty_graph(create_using=nx.MultiGraph())
         assert H.is_multigraph()
         assert not H.is_directed()
@@ -274,10 +277,10 @@ class TestGeneratorClassic:
 
     def test_empty_graph(self):
         G = nx.empty_graph()
-        assert nx.number_of_nodes(G) == 0
+        assert G.number_of_nodes() == 0
         G = nx.empty_graph(42)
-        assert nx.number_of_nodes(G) == 42
-        assert nx.number_of_edges(G) == 0
+        assert G.number_of_nodes() == 42
+        assert G.number_of_edges() == 0
 
         G = nx.empty_graph("abc")
         assert len(G) == 3
@@ -285,27 +288,26 @@ class TestGeneratorClassic:
 
         # create empty digraph
         G = nx.empty_graph(42, create_using=nx.DiGraph(name="duh"))
-        assert nx.number_of_nodes(G) == 42
-        assert nx.number_of_edges(G) == 0
+        assert G.number_of_nodes() == 42
+        assert G.number_of_edges() == 0
         assert isinstance(G, nx.DiGraph)
 
         # create empty multigraph
         G = nx.empty_graph(42, create_using=nx.MultiGraph(name="duh"))
-        assert nx.number_of_nodes(G) == 42
-        assert nx.number_of_edges(G) == 0
+        assert G.number_of_nodes() == 42
+        assert G.number_of_edges() == 0
         assert isinstance(G, nx.MultiGraph)
 
         # create empty graph from another
-        pete = nx.petersen_graph()
-        G = nx.empty_graph(42, create_using=pete)
-        assert nx.number_of_nodes(G) == 42
-        assert nx.number_of_edges(G) == 0
+        G = nx.empty_graph(42, create_using=nx.path_graph(3))
+        assert G.number_of_nodes() == 42
+        assert G.number_of_edges() == 0
         assert isinstance(G, nx.Graph)
 
     def test_ladder_graph(self):
+        assert _is_empty_like(nx.ladder_graph(0), 0)
         for i, G in [
-            (0, nx.empty_graph(0)),
-            (1, nx.path_graph(2)),
+            (1, _cached_path(2)),
             (2, nx.hypercube_graph(2)),
             (10, nx.grid_graph([2, 10])),
         ]:
@@ -317,49 +319,52 @@ class TestGeneratorClassic:
         mg = nx.ladder_graph(2, create_using=nx.MultiGraph)
         assert edges_equal(mg.edges(), g.edges())
 
-    def test_lollipop_graph(self):
+    @pytest.mark.parametrize("m1, m2", [(3, 5), (4, 10), (3, 20)])
+    def test_lollipop_graph(self, m1, m2):
         # number of nodes = m1 + m2
         # number of edges = nx.number_of_edges(nx.complete_graph(m1)) + m2
-        for m1, m2 in [(3, 5), (4, 10), (3, 20)]:
-            b = nx.lollipop_graph(m1, m2)
-            assert nx.number_of_nodes(b) == m1 + m2
-            assert nx.number_of_edges(b) == m1 * (m1 - 1) / 2 + m2
+        b = nx.lollipop_graph(m1, m2)
+        assert b.number_of_nodes() == m1 + m2
+        assert b.number_of_edges() == m1 * (m1 - 1) / 2 + m2
 
+    def test_lollipop_graph_errors(self):
         # Raise NetworkXError if m<2
         pytest.raises(nx.NetworkXError, nx.lollipop_graph, 1, 20)
 
         # Raise NetworkXError if n<0
         pytest.raises(nx.NetworkXError, nx.lollipop_graph, 5, -2)
 
-        # lollipop_graph(2,m) = path_graph(m+2)
-        for m1, m2 in [(2, 5), (2, 10), (2, 20)]:
-            b = nx.lollipop_graph(m1, m2)
-            assert is_isomorphic(b, nx.path_graph(m2 + 2))
-
         pytest.raises(
-            nx.NetworkXError, nx.lollipop_graph, m1, m2, create_using=nx.DiGraph
+            nx.NetworkXError, nx.lollipop_graph, 2, 20, create_using=nx.DiGraph
         )
 
-        mb = nx.lollipop_graph(m1, m2, create_using=nx.MultiGraph)
+    @pytest.mark.parametrize("m2", [5, 10, 20])
+    def test_lollipop_graph_path(self, m2):
+        # lollipop_graph(2,m) = path_graph(m+2), with the same labels
+        b = nx.lollipop_graph(2, m2)
+        assert edges_equal(b.edges(), _cached_path(m2 + 2).edges())
+
+        mb = nx.lollipop_graph(2, m2, create_using=nx.MultiGraph)
         assert edges_equal(mb.edges(), b.edges())
 
+    def test_lollipop_graph_node_labels(self):
         g = nx.lollipop_graph([1, 2, 3, 4], "abc")
         assert len(g) == 7
         assert g.size() == 9
 
     def test_null_graph(self):
-        assert nx.number_of_nodes(nx.null_graph()) == 0
+        assert nx.null_graph().number_of_nodes() == 0
 
     def test_path_graph(self):
         p = nx.path_graph(0)
-        assert is_isomorphic(p, nx.null_graph())
+        assert _is_empty_like(p, 0)
 
         p = nx.path_graph(1)
-        assert is_isomorphic(p, nx.empty_graph(1))
+        assert _is_empty_like(p, 1)
 
         p = nx.path_graph(10)
         assert nx.is_connected(p)
-        assert sorted(d for n, d in p.degree()) == [1, 1, 2, 2, 2, 2, 2, 2, 2, 2]
+        assert Counter(d for _, d in p.degree()) == {1: 2, 2: 8}
         assert p.order() - 1 == p.size()
 
         dp = nx.path_graph(3, create_using=nx.DiGraph)
@@ -379,13 +384,13 @@ class TestGeneratorClassic:
 
     def test_star_graph(self):
         star_graph = nx.star_graph
-        assert is_isomorphic(star_graph(0), nx.empty_graph(1))
-        assert is_isomorphic(star_graph(1), nx.path_graph(2))
-        assert is_isomorphic(star_graph(2), nx.path_graph(3))
+        assert _is_empty_like(star_graph(0), 1)
+        assert is_isomorphic(star_graph(1), _cached_path(2))
+        assert is_isomorphic(star_graph(2), _cached_path(3))
         assert is_isomorphic(star_graph(5), nx.complete_bipartite_graph(1, 5))
 
         s = star_graph(10)
-        assert sorted(d for n, d in s.degree()) == [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 10]
+        assert Counter(d for _, d in s.degree()) == {1: 10, 10: 1}
 
         pytest.raises(nx.NetworkXError, star_graph, 10, create_using=nx.DiGraph)
 
@@ -397,19 +402,19 @@ class TestGeneratorClassic:
         assert G.size() == 6
 
     def test_trivial_graph(self):
-        assert nx.number_of_nodes(nx.trivial_graph()) == 1
+        assert nx.trivial_graph().number_of_nodes() == 1
 
     def test_turan_graph(self):
-        assert nx.number_of_edges(nx.turan_graph(13, 4)) == 63
+        assert nx.turan_graph(13, 4).number_of_edges() == 63
         assert is_isomorphic(
             nx.turan_graph(13, 4), nx.complete_multipartite_graph(3, 4, 3, 3)
         )
 
     def test_wheel_graph(self):
+        assert _is_empty_like(nx.wheel_graph(0), 0)
+        assert _is_empty_like(nx.wheel_graph(1), 1)
         for n, G in [
-            (0, nx.null_graph()),
-            (1, nx.empty_graph(1)),
-            (2, nx.path_graph(2)),
+            (2, _cached_path(2)),
             (3, nx.complete_graph(3)),
             (4, nx.complete_graph(4)),
         ]:
@@ -417,7 +422,7 @@ class TestGeneratorClassic:
             assert is_isomorphic(g, G)
 
         g = nx.wheel_graph(10)
-        assert sorted(d for n, d in g.degree()) == [3, 3, 3, 3, 3, 3, 3, 3, 3, 9]
+        assert Counter(d for _, d in g.degree()) == {3: 9, 9: 1}
 
         pytest.raises(nx.NetworkXError, nx.wheel_graph, 10, create_using=nx.DiGraph)
 
@@ -456,13 +461,15 @@ class TestGeneratorClassic:
         """Tests for generating the complete multipartite graph."""
         G = nx.complete_multipartite_graph(2, 3, 4)
         blocks = [(0, 1), (2, 3, 4), (5, 6, 7, 8)]
+        adj = {u: set(nbrs) for u, nbrs in G.adj.items()}
+        attrs = dict(G.nodes(data=True))
         # Within each block, no two vertices should be adjacent.
         for block in blocks:
-            for u, v in itertools.combinations_with_replacement(block, 2):
-                assert v not in G[u]
-                assert G.nodes[u] == G.nodes[v]
+            for u in block:
+                assert adj[u].isdisjoint(block)
+                assert attrs[u] == attrs[block[0]]
         # Across blocks, all vertices should be adjacent.
-        for (block1, block2) in itertools.combinations(blocks, 2):
-            for u, v in itertools.product(block1, block2):
-                assert v in G[u]
-                assert G.nodes[u] != G.nodes[v]
+        for block1, block2 in itertools.combinations(blocks, 2):
+            for u in block1:
+                assert adj[u].issuperset(block2)
+            assert attrs[block1[0]] != attrs[block2[0]]
@@ -14,14 +14,14 @@ class _PCGSolver:
     """Preconditioned conjugate gradient method.
 
     To solve Ax = b:
-        M = A.diagonal() # or some other preconditioner
-        solver = _PCGSolver(lambda x: A * x, lambda x: M * x)
+        M = 1.0 / A.diagonal() # Jacobi, or some other preconditioner
+        solver = _PCGSolver(A, M)
         x = solver.solve(b)
 
-    The inputs A and M are functions which compute
-    matrix multiplication on the argument.
-    A - multiply by the matrix A in Ax=b
-    M - multiply by M, the preconditioner surragate for A
+    The input A is a sparse matrix and M is a 1-D array holding the
+    diagonal of the inverse of the preconditioner.
+    A - the matrix A in Ax=b
+    M - the diagonal of the inverse of the preconditioner surragate for A
 
     Warning: There is no limit on number of iterations.
     """
@@ -50,18 +50,18 @@ class _PCGSolver:
         # Initialize.
         x = np.zeros(b.shape)
         r = b.copy()
-        z = M(r)
+        z = M * r
         rz = sp.linalg.blas.ddot(r, z)
         p = z.copy()
         # Iterate.
         while True:
-            Ap = A(p)
+            Ap = A @ p
             alpha = rz / sp.linalg.blas.ddot(p, Ap)
             x = sp.linalg.blas.daxpy(p, x, a=alpha)
             r = sp.linalg.blas.daxpy(Ap, r, a=-alpha)
             if sp.linalg.blas.dasum(r) < tol:
                 return x
-            z = M(r)
+            z = M * r
             beta = sp.linalg.blas.ddot(r, z)
             beta, rz = beta / rz, beta
             p = sp.linalg.blas.daxpy(p, z, a=beta)
@@ -107,33 +107,24 @@ class _LUSolver:
     def solve(self, B, tol=None):
         import numpy as np
 
-        B = np.asarray(B)
-        X = np.ndarray(B.shape, order="F")
-        for j in range(B.shape[1]):
-            X[:, j] = self._LU.solve(B[:, j])
-        return X
+        # SuperLU solves for all columns of B in a single call
+        return self._LU.solve(np.asarray(B, dtype=float))
 
 
 def _preprocess_graph(G, weight):
     """Compute edge weights and eliminate zero-weight edges."""
-    if G.is_directed():
-        H = nx.MultiGraph()
-        H.add_nodes_from(G)
-        H.add_weighted_edges_from(
-            ((u, v, e.get(weight, 1.0)) for u, v, e in G.edges(data=True) if u != v),
-            weight=weight,
-        )
-        G = H
-    if not G.is_multigraph():
-        edges = (
-            (u, v, abs(e.get(weight, 1.0))) for u, v, e in G.edges(data=True) if u != v
-        )
-    else:
-        edges = (
-            (u, v, sum(abs(e.get(weight, 1.0)) for e in G[u][v].values()))
-            for u, v in G.edges()
-            if u != v
-        )
+    edges = (
+        (u, v, abs(e.get(weight, 1.0))) for u, v, e in G.edges(data=True) if u != v
+    )
+    if G.is_directed() or G.is_multigraph():
+        # Sum the weights of parallel and antiparallel edges in one pass,
+        # keyed by the orientation in which each pair is first seen.
+        weights = {}
+        for u, v, w in edges:
+            if (v, u) in weights:
+                u, v = v, u
+            weights[u, v] = weights.get((u, v), 0) + w
+        edges = ((u, v, w) for (u, v), w in weights.items())
     H = nx.Graph()
     H.add_nodes_from(G)
     H.add_weighted_edges_from((u, v, e) for u, v, e in edges if e != 0)
@@ -149,12 +140,43 @@ def _rcm_estimate(G, nodelist):
     n = len(nodelist)
     index = dict(zip(nodelist, range(n)))
     x = np.ndarray(n, dtype=float)
-    for i, u in enumerate(order):
-        x[index[u]] = i
+    # Scatter the RCM positions into nodelist order with a single store
+    x[np.fromiter((index[u] for u in order), dtype=np.intp, count=n)] = np.arange(n)
     x -= (n - 1) / 2.0
     return x
 
 
+def _scale_symmetric(L, d):
+    """Returns a copy of the CSR or CSC matrix `L` with entry (i, j)
+    multiplied by d[i] * d[j], the product D * L * D for D = diag(d).
+    """
+    import numpy as np
+
+    L = L.astype(float)  # A copy, so the caller's matrix is left untouched.
+    major = np.repeat(np.arange(L.shape[0]), np.diff(L.indptr))
+    L.data *= d[major] * d[L.indices]
+    return L
+
+
+def _project_normalized(X, e):
+    """Make X orthogonal to the nullspace of L, spanned by the unit vector e."""
+    import numpy as np
+
+    X = np.asarray(X)
+    for j in range(X.shape[1]):
+        X[:, j] -= (X[:, j] @ e) * e
+
+
+def _project_unnormalized(X):
+    """Make X orthogonal to the nullspace of L, the constant vectors."""
+    import numpy as np
+
+    X = np.asarray(X)
+    n = X.shape[0]
+    for j in range(X.shape[1]):
+        X[:, j] -= X[:, j].sum() / n
+
+
 def _tracemin_fiedler(L, X, normalized, tol, method):
     """Compute the Fiedler vector of L using the TraceMIN-Fiedler algorithm.
 
@@ -194,36 +216,35 @@ def _tracemin_fiedler(L, X, normalized, tol, method):
     import scipy.linalg  # call as sp.linalg
     import scipy.linalg.blas  # call as sp.linalg.blas
     import scipy.sparse  # call as sp.sparse
+    import scipy.sparse.csgraph  # call as sp.sparse.csgraph
 
     n = X.shape[0]
 
+    perm = None
+    if method == "tracemin_pcg" and n > 1000:
+        # Relabel L by reverse Cuthill-McKee so that the rows touched by each
+        # matrix-vector product in the PCG solver lie close together in
+        # memory. The LU solver orders the matrix itself.
+        perm = sp.sparse.csgraph.reverse_cuthill_mckee(
+            sp.sparse.csr_matrix(L), symmetric_mode=True
+        )
+        L = L[perm][:, perm]
+        X = X[perm]
+
     if normalized:
         # Form the normalized Laplacian matrix and determine the eigenvector of
         # its nullspace.
         e = np.sqrt(L.diagonal())
-        D = sp.sparse.spdiags(1.0 / e, [0], n, n, format="csr")
-        L = D * L * D
+        L = _scale_symmetric(L, 1.0 / e)
         e *= 1.0 / np.linalg.norm(e, 2)
-
-    if normalized:
-
-        def project(X):
-            """Make X orthogonal to the nullspace of L."""
-            X = np.asarray(X)
-            for j in range(X.shape[1]):
-                X[:, j] -= (X[:, j] @ e) * e
-
+        project = partial(_project_normalized, e=e)
     else:
-
-        def project(X):
-            """Make X orthogonal to the nullspace of L."""
-            X = np.asarray(X)
-            for j in range(X.shape[1]):
-                X[:, j] -= X[:, j].sum() / n
+        project = _project_unnormalized
 
     if method == "tracemin_pcg":
+        # Jacobi preconditioner: scale the residual by the inverse diagonal
         D = L.diagonal().astype(float)
-        solver = _PCGSolver(lambda x: L * x, lambda x: D * x)
+        solver = _PCGSolver(L, 1.0 / D)
     elif method == "tracemin_lu" or method == "tracemin_chol":
         # Convert A to CSC to suppress SparseEfficiencyWarning.
         A = sp.sparse.csc_matrix(L, dtype=float, copy=True)
@@ -241,21 +262,35 @@ def _tracemin_fiedler(L, X, normalized, tol, method):
         raise nx.NetworkXError("Unknown linear system solver: " + method)
 
     # Initialize.
-    Lnorm = abs(L).sum(axis=1).flatten().max()
+    # The largest absolute row sum of L, read off the CSR arrays without
+    # building abs(L). Each row of the Laplacian of a connected graph holds
+    # its nonzero diagonal entry, so no row is empty.
+    Lcsr = L.tocsr()
+    Lnorm = np.add.reduceat(np.abs(Lcsr.data), Lcsr.indptr[:-1]).max()
     project(X)
     W = np.ndarray(X.shape, order="F")
 
     while True:
-        # Orthonormalize X.
-        X = np.linalg.qr(X)[0]
-        # Compute iteration matrix H.
-        W[:, :] = L @ X
-        H = X.T @ W
-        sigma, Y = sp.linalg.eigh(H, overwrite_a=True)
-        # Compute the Ritz vectors.
-        X = X @ Y
-        # Test for convergence exploiting the fact that L * X == W * Y.
-        res = sp.linalg.blas.dasum(W @ Y[:, 0] - sigma[0] * X[:, 0]) / Lnorm
+        if X.shape[1] == 1:
+            # With a single column, the QR step only normalizes X (with the
+            # sign LAPACK gives it), H is the Rayleigh quotient and the Ritz
+            # step leaves X unchanged.
+            X /= -np.copysign(np.linalg.norm(X), X[0, 0])
+            W[:, :] = L @ X
+            sigma = X[:, 0] @ W[:, 0]
+            res = sp.linalg.blas.dasum(W[:, 0] - sigma * X[:, 0]) / Lnorm
+            sigma = np.array([sigma])
+        else:
+            # Orthonormalize X.
+            X = np.linalg.qr(X)[0]
+            # Compute iteration matrix H.
+            W[:, :] = L @ X
+            H = X.T @ W
+            sigma, Y = sp.linalg.eigh(H, overwrite_a=True)
+            # Compute the Ritz vectors.
+            X = X @ Y
+            # Test for convergence exploiting the fact that L * X == W * Y.
+            res = sp.linalg.blas.dasum(W @ Y[:, 0] - sigma[0] * X[:, 0]) / Lnorm
         if res < tol:
             break
         # Compute X = L \ X / (X' * (L \ X)).
@@ -265,7 +300,12 @@ def _tracemin_fiedler(L, X, normalized, tol, method):
         X = (sp.linalg.inv(W.T @ X) @ W.T).T  # Preserves Fortran storage order.
         project(X)
 
-    return sigma, np.asarray(X)
+    X = np.asarray(X)
+    if perm is not None:
+        # Undo the reverse Cuthill-McKee relabeling.
+        X_perm, X = X, np.empty_like(X)
+        X[perm] = X_perm
+    return sigma, X
 
 
 def _get_fiedler_func(method):
@@ -292,10 +332,8 @@ def _get_fiedler_func(method):
             L = sp.sparse.csc_matrix(L, dtype=float)
             n = L.shape[0]
             if normalized:
-                D = sp.sparse.spdiags(
-                    1.0 / np.sqrt(L.diagonal()), [0], n, n, format="csc"
-                )
-                L = D * L * D
+                d = 1.0 / np.sqrt(L.diagonal())
+                L = _scale_symmetric(L, d)
             if method == "lanczos" or n < 10:
                 # Avoid LOBPCG when n < 10 due to
                 # https://github.com/scipy/scipy/issues/3592
@@ -309,12 +347,23 @@ def _get_fiedler_func(method):
                 M = sp.sparse.spdiags(1.0 / L.diagonal(), [0], n, n)
                 Y = np.ones(n)
                 if normalized:
-                    Y /= D.diagonal()
+                    Y /= d
                 sigma, X = sp.sparse.linalg.lobpcg(
                     L, X, M=M, Y=np.atleast_2d(Y).T, tol=tol, maxiter=n, largest=False
                 )
                 return sigma[0], X[:, 0]
 
+    elif method == "dense":
+
+        def find_fiedler(L, x, normalized, tol, seed):
+            import scipy as sp
+            import scipy.linalg  # call as sp.linalg
+
+            if normalized:
+                L = _scale_symmetric(L, 1.0 / np.sqrt(L.diagonal()))
+            sigma, X = sp.linalg.eigh(L.toarray().astype(float), subset_by_index=[1, 1])
+            return sigma[0], X[:, 0]
+
     else:
         raise nx.NetworkXError(f"unknown method {method!r}.")
 
@@ -348,8 +397,8 @@ def algebraic_connectivity(
 
     method : string, optional (default: 'tracemin_pcg')
         Method of eigenvalue computation. It must be one of the tracemin
-        options shown below (TraceMIN), 'lanczos' (Lanczos iteration)
-        or 'lobpcg' (LOBPCG).
+        options shown below (TraceMIN), 'lanczos' (Lanczos iteration),
+        'lobpcg' (LOBPCG) or 'dense' (LAPACK on the dense Laplacian).
 
         The TraceMIN algorithm uses a linear system solver. The following
         values allow specifying the solver to be used.
@@ -361,6 +410,10 @@ def algebraic_connectivity(
         'tracemin_lu'   LU factorization
         =============== ========================================
 
+        'dense' builds the full n x n Laplacian and ignores `tol` and
+        `seed`. It is usually the fastest choice for graphs with up to a
+        few hundred nodes.
+
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
@@ -431,8 +484,8 @@ def fiedler_vector(
 
     method : string, optional (default: 'tracemin_pcg')
         Method of eigenvalue computation. It must be one of the tracemin
-        options shown below (TraceMIN), 'lanczos' (Lanczos iteration)
-        or 'lobpcg' (LOBPCG).
+        options shown below (TraceMIN), 'lanczos' (Lanczos iteration),
+        'lobpcg' (LOBPCG) or 'dense' (LAPACK on the dense Laplacian).
 
         The TraceMIN algorithm uses a linear system solver. The following
         values allow specifying the solver to be used.
@@ -444,6 +497,10 @@ def fiedler_vector(
         'tracemin_lu'   LU factorization
         =============== ========================================
 
+        'dense' builds the full n x n Laplacian and ignores `tol` and
+        `seed`. It is usually the fastest choice for graphs with up to a
+        few hundred nodes.
+
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
@@ -515,8 +572,8 @@ def spectral_ordering(
 
     method : string, optional (default: 'tracemin_pcg')
         Method of eigenvalue computation. It must be one of the tracemin
-        options shown below (TraceMIN), 'lanczos' (Lanczos iteration)
-        or 'lobpcg' (LOBPCG).
+        options shown below (TraceMIN), 'lanczos' (Lanczos iteration),
+        'lobpcg' (LOBPCG) or 'dense' (LAPACK on the dense Laplacian).
 
         The TraceMIN algorithm uses a linear system solver. The following
         values allow specifying the solver to be used.
@@ -528,6 +585,10 @@ def spectral_ordering(
         'tracemin_lu'   LU factorization
         =============== ========================================
 
+        'dense' builds the full n x n Laplacian and ignores `tol` and
+        `seed`. It is usually the fastest choice for graphs with up to a
+        few hundred nodes.
+
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
@@ -551,20 +612,30 @@ def spectral_ordering(
     --------
     laplacian_matrix
     """
+    import numpy as np
+
     if len(G) == 0:
         raise nx.NetworkXError("graph is empty.")
     G = _preprocess_graph(G, weight)
 
     find_fiedler = _get_fiedler_func(method)
     order = []
+    # The Laplacian of G is built once and sliced for each component.
+    L_full = None
     for component in nx.connected_components(G):
         size = len(component)
         if size > 2:
-            L = nx.laplacian_matrix(G, component)
+            if L_full is None:
+                L_full = nx.laplacian_matrix(G).tocsr()
+                index = {u: i for i, u in enumerate(G)}
+            idx = [index[u] for u in component]
+            L = L_full[idx][:, idx]
             x = None if method != "lobpcg" else _rcm_estimate(G, component)
             sigma, fiedler = find_fiedler(L, x, normalized, tol, seed)
-            sort_info = zip(fiedler, range(size), component)
-            order.extend(u for x, c, u in sorted(sort_info))
+            # A stable argsort breaks ties by position in component, as
+            # sorting (fiedler, position, node) triples would.
+            nodes = list(component)
+            order.extend(nodes[i] for i in np.argsort(fiedler, kind="stable"))
         else:
             order.extend(component)
 
@@ -1,4 +1,5 @@
-from math import sqrt
+import random
+from math import cos, pi, sqrt
 
 import pytest
 
@@ -173,6 +174,37 @@ class TestAlgebraicConnectivity:
         x = nx.fiedler_vector(G, tol=1e-12, method=method, seed=1)
         check_eigenvector(A, sigma, x)
 
+    def test_dense(self):
+        pytest.importorskip("scipy")
+        G = nx.path_graph(8)
+        A = nx.laplacian_matrix(G)
+        sigma = 2 - sqrt(2 + sqrt(2))
+        ac = nx.algebraic_connectivity(G, method="dense")
+        assert ac == pytest.approx(sigma, abs=1e-7)
+        x = nx.fiedler_vector(G, method="dense")
+        check_eigenvector(A, sigma, x)
+        ac = nx.algebraic_connectivity(G, normalized=True, method="dense")
+        assert ac == pytest.approx(1 - cos(pi / 7), abs=1e-7)
+        order = nx.spectral_ordering(G, method="dense")
+        assert order in ([0, 1, 2, 3, 4, 5, 6, 7], [7, 6, 5, 4, 3, 2, 1, 0])
+
+    def test_reordered_large_grid(self):
+        # More than 1000 nodes added in shuffled order, so tracemin_pcg
+        # relabels the Laplacian by reverse Cuthill-McKee
+        pytest.importorskip("scipy")
+        grid = nx.grid_2d_graph(32, 32)
+        nodes = list(grid)
+        random.Random(42).shuffle(nodes)
+        G = nx.Graph()
+        G.add_nodes_from(nodes)
+        G.add_edges_from(grid.edges())
+        A = nx.laplacian_matrix(G)
+        sigma = 2 - 2 * cos(pi / 32)
+        ac = nx.algebraic_connectivity(G, tol=1e-12, method="tracemin_pcg")
+        assert ac == pytest.approx(sigma, abs=1e-7)
+        x = nx.fiedler_vector(G, tol=1e-12, method="tracemin_pcg")
+        check_eigenvector(A, sigma, x)
+
     @pytest.mark.parametrize(
         ("normalized", "sigma", "laplacian_fn"),
         (
@@ -9,3 +9,130 @@ def test_namespace_alias():
 def test_namespace_nesting():
     with pytest.raises(ImportError):
         from graphnetworkx.exception import NetworkX
+
+
+def test_lazy_generators():
+    import importlib
+    import pkgutil
+
+    import graphnetworkx as nx
+
+    # Every generator submodule must be in the lazy map with its whole
+    # __all__, except harary_graph, which was never star-imported.
+    submodules = {
+        info.name
+        for info in pkgutil.iter_modules(nx.generators.__path__)
+        if info.name not in ("tests", "harary_graph")
+    }
+    assert submodules == set(nx.generators._submodule_names)
+    for modname, names in nx.generators._submodule_names.items():
+        module = importlib.import_module(f"graphnetworkx.generators.{modname}")
+        assert list(names) == module.__all__
+        for name in names:
+            assert getattr(nx, name) is getattr(module, name)
+    assert nx.generators.classic is importlib.import_module(
+        "graphnetworkx.generators.classic"
+    )
+
+
+def _run_fresh(code):
+    """Runs `code` in a new interpreter, where graphnetworkx is not imported."""
+    import os
+    import subprocess
+    import sys
+
+    import graphnetworkx as nx
+
+    env = dict(os.environ)
+    path = os.path.dirname(os.path.dirname(os.path.abspath(nx.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [path, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_lazy_concurrent_first_access():
+    _run_fresh(
+        """
+import threading
+import graphnetworkx as nx
+
+barrier = threading.Barrier(8)
+errors = []
+
+def use_algorithm():
+    barrier.wait()
+    try:
+        assert nx.shortest_path(nx.path_graph(3), 0, 2) == [0, 1, 2]
+    except Exception as err:
+        errors.append(err)
+
+threads = [threading.Thread(target=use_algorithm) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert not errors, errors
+"""
+    )
+
+
+def test_lazy_star_import():
+    _run_fresh(
+        """
+namespace = {}
+exec("from graphnetworkx import *", namespace)
+for name in ("Graph", "path_graph", "shortest_path", "laplacian_matrix", "draw"):
+    assert name in namespace, name
+"""
+    )
+
+
+def test_lazy_access_before_full_load():
+    _run_fresh(
+        """
+import sys
+import graphnetworkx as nx
+
+assert "graphnetworkx.algorithms" not in sys.modules
+assert "shortest_path" in dir(nx)
+"""
+    )
+    _run_fresh(
+        """
+import sys
+import graphnetworkx as nx
+
+assert "graphnetworkx.algorithms" not in sys.modules
+assert nx.shortest_path(nx.path_graph(3), 0, 2) == [0, 1, 2]
+assert nx.tree is sys.modules["graphnetworkx.algorithms.tree"]
+"""
+    )
+
+
+def test_lazy_failed_import_is_retried():
+    _run_fresh(
+        """
+import importlib
+import graphnetworkx as nx
+
+import_module = importlib.import_module
+
+def fail_linalg(name, *args):
+    if name == "graphnetworkx.linalg":
+        raise ImportError("linalg unavailable")
+    return import_module(name, *args)
+
+importlib.import_module = fail_linalg
+try:
+    nx.laplacian_matrix
+except ImportError:
+    pass
+else:
+    raise AssertionError("the failing import was not attempted")
+importlib.import_module = import_module
+assert nx.laplacian_matrix is nx.linalg.laplacian_matrix
+assert nx.draw is nx.drawing.draw
+"""
+    )
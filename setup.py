@@ -1,7 +1,6 @@
-from glob import glob
 import os
+import re
 import sys
-from setuptools import setup
 
 if sys.version_info[:2] < (3, 7):
     error = (
@@ -24,8 +23,8 @@ project_urls = {
     "Documentation": "https://networkx.org/documentation/stable/",
     "Source Code": "https://github.com/taylortech75/graphnetworkx",
 }
-platforms = ["Linux", "Mac OSX", "Windows", "Unix"]
-keywords = [
+platforms = ("Linux", "Mac OSX", "Windows", "Unix")
+keywords = (
     "Networks",
     "Graph Theory",
     "Mathematics",
@@ -33,8 +32,8 @@ keywords = [
     "graph",
     "discrete mathematics",
     "math",
-]
-classifiers = [
+)
+classifiers = (
     "Development Status :: 5 - Production/Stable",
     "Intended Audience :: Developers",
     "Intended Audience :: Science/Research",
@@ -54,15 +53,14 @@ classifiers = [
     "Topic :: Scientific/Engineering :: Information Analysis",
     "Topic :: Scientific/Engineering :: Mathematics",
     "Topic :: Scientific/Engineering :: Physics",
-]
+)
 
-with open("graphnetworkx/__init__.py") as fid:
-    for line in fid:
-        if line.startswith("__version__"):
-            version = line.strip().split()[-1][1:-1]
-            break
+with open("graphnetworkx/__init__.py", encoding="utf-8") as fid:
+    version = re.search(
+        r"^__version__\s*=\s*[\"']([^\"']+)", fid.read(), re.MULTILINE
+    ).group(1)
 
-packages = [
+packages = (
     "graphnetworkx",
     "graphnetworkx.algorithms",
     "graphnetworkx.algorithms.assortativity",
@@ -91,12 +89,29 @@ packages = [
     "graphnetworkx.tests",
     "graphnetworkx.testing",
     "graphnetworkx.utils",
-]
+)
 
 docdirbase = "share/doc/graphnetworkx-%s" % version
+
+
+def data_files(pp, exts=None):
+    """Returns the files in directory pp, grouped by extension if exts is given."""
+    files = {ext: [] for ext in exts} if exts is not None else {None: []}
+    try:
+        with os.scandir(pp or ".") as entries:
+            for entry in entries:
+                ext = os.path.splitext(entry.name)[1] if exts is not None else None
+                if ext in files and not entry.name.startswith(".") and entry.is_file():
+                    files[ext].append(os.path.join(pp, entry.name))
+    except FileNotFoundError:
+        pass
+    return [path for paths in files.values() for path in paths]
+
+
 # add basic documentation
-data = [(docdirbase, glob("*.txt"))]
+data = [(docdirbase, data_files("", (".txt",)))]
 # add examples
+example_exts = (".txt", ".py", ".bz2", ".gz", ".mbox", ".edgelist")
 for d in [
     ".",
     "advanced",
@@ -112,66 +127,39 @@ for d in [
 ]:
     dd = os.path.join(docdirbase, "examples", d)
     pp = os.path.join("examples", d)
-    data.append((dd, glob(os.path.join(pp, "*.txt"))))
-    data.append((dd, glob(os.path.join(pp, "*.py"))))
-    data.append((dd, glob(os.path.join(pp, "*.bz2"))))
-    data.append((dd, glob(os.path.join(pp, "*.gz"))))
-    data.append((dd, glob(os.path.join(pp, "*.mbox"))))
-    data.append((dd, glob(os.path.join(pp, "*.edgelist"))))
+    data.append((dd, data_files(pp, example_exts)))
 # add js force examples
 dd = os.path.join(docdirbase, "examples", "javascript/force")
 pp = os.path.join("examples", "javascript/force")
-data.append((dd, glob(os.path.join(pp, "*"))))
+data.append((dd, data_files(pp)))
 
 # add the tests
-package_data = {
-    "graphnetworkx": ["tests/*.py"],
-    "graphnetworkx.algorithms": ["tests/*.py"],
-    "graphnetworkx.algorithms.assortativity": ["tests/*.py"],
-    "graphnetworkx.algorithms.bipartite": ["tests/*.py"],
-    "graphnetworkx.algorithms.node_classification": ["tests/*.py"],
-    "graphnetworkx.algorithms.centrality": ["tests/*.py"],
-    "graphnetworkx.algorithms.community": ["tests/*.py"],
-    "graphnetworkx.algorithms.components": ["tests/*.py"],
-    "graphnetworkx.algorithms.connectivity": ["tests/*.py"],
-    "graphnetworkx.algorithms.coloring": ["tests/*.py"],
-    "graphnetworkx.algorithms.minors": ["tests/*.py"],
-    "graphnetworkx.algorithms.flow": ["tests/*.py", "tests/*.bz2"],
-    "graphnetworkx.algorithms.isomorphism": ["tests/*.py", "tests/*.*99"],
-    "graphnetworkx.algorithms.link_analysis": ["tests/*.py"],
-    "graphnetworkx.algorithms.approximation": ["tests/*.py"],
-    "graphnetworkx.algorithms.operators": ["tests/*.py"],
-    "graphnetworkx.algorithms.shortest_paths": ["tests/*.py"],
-    "graphnetworkx.algorithms.traversal": ["tests/*.py"],
-    "graphnetworkx.algorithms.tree": ["tests/*.py"],
-    "graphnetworkx.classes": ["tests/*.py"],
-    "graphnetworkx.generators": ["tests/*.py", "atlas.dat.gz"],
-    "graphnetworkx.drawing": ["tests/*.py"],
-    "graphnetworkx.linalg": ["tests/*.py"],
-    "graphnetworkx.readwrite": ["tests/*.py"],
-    "graphnetworkx.readwrite.json_graph": ["tests/*.py"],
-    "graphnetworkx.testing": ["tests/*.py"],
-    "graphnetworkx.utils": ["tests/*.py", "*.pem"],
-}
+# Every package ships its tests, and a few also ship data files.
+package_data = {pkg: ["tests/*.py"] for pkg in packages if not pkg.endswith(".tests")}
+package_data["graphnetworkx.algorithms.flow"].append("tests/*.bz2")
+package_data["graphnetworkx.algorithms.isomorphism"].append("tests/*.*99")
+package_data["graphnetworkx.generators"].append("atlas.dat.gz")
+package_data["graphnetworkx.utils"].append("*.pem")
 
 
 def parse_requirements_file(filename):
     with open(filename) as fid:
-        requires = [l.strip() for l in fid.readlines() if not l.startswith("#")]
+        requires = [l.strip() for l in fid.read().splitlines() if not l.startswith("#")]
 
     return requires
 
 
 install_requires = []
 extras_require = {
-    dep: parse_requirements_file("requirements/" + dep + ".txt")
-    for dep in ["default", "developer", "doc", "extra", "test"]
+    dep: parse_requirements_file("requirements/%s.txt" % dep)
+    for dep in ("default", "developer", "doc", "extra", "test")
 }
 
-with open("README.rst", "r") as fh:
-    long_description = fh.read()
-
 if __name__ == "__main__":
+    from setuptools import setup
+
+    with open("README.rst", "r", encoding="utf-8") as fh:
+        long_description = fh.read()
 
     setup(
         name=name,